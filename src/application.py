@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Optional
 
 from PyQt6.QtWidgets import QApplication
@@ -22,21 +23,26 @@ class ApplicationFacade:
 
     Construction order matters:
     1. SettingsService — loaded first so all services read a consistent config.
-    2. PoseDetector — initialised next; its pre-warm timing drives the adaptive
-       resolution decision in step 3.
-    3. Adaptive resolution check — may lower frame_width/height in settings and on
-       the detector before CameraService or any other consumer reads them.
-    4. Remaining services (CameraService, ScoreService, NotificationService).
-    5. Optional Database — only created when enable_database_logging is True.
-    6. PostureTrackerTray — receives all services and starts the Qt event loop.
+    2. PoseDetector — built and pre-warmed on a background thread so the tray
+       appears without waiting for the MediaPipe graph.
+    3. Remaining services (CameraService, ScoreService, NotificationService).
+    4. Optional Database — only created when enable_database_logging is True.
+    5. PostureTrackerTray — receives all services and starts the Qt event loop.
+    6. Adaptive resolution check — runs on the GUI thread the first time the tray
+       asks for the detector, so the settings write never races the UI and the
+       lower resolution is in place before the first frame is processed.
     """
 
     def __init__(self, app: QApplication) -> None:
         self._qt_app = app
         self.settings = SettingsService()
         self.scheduler = TaskScheduler()
-        self.pose_detector = PoseDetector(self.settings)
-        self._maybe_apply_adaptive_resolution()
+        self.pose_detector: Optional[PoseDetector] = None
+        self._detector_applied = False
+        self._detector_thread = threading.Thread(
+            target=self._build_detector, name="pose-detector-init", daemon=True
+        )
+        self._detector_thread.start()
         self.camera_service = CameraService(self.settings)
         self.score_service = ScoreService(self.settings)
         self.notification_service = NotificationService(
@@ -51,7 +57,7 @@ class ApplicationFacade:
 
         self.tray = PostureTrackerTray(
             settings=self.settings,
-            detector=self.pose_detector,
+            detector_provider=self.get_pose_detector,
             camera_service=self.camera_service,
             score_service=self.score_service,
             notification_service=self.notification_service,
@@ -59,6 +65,24 @@ class ApplicationFacade:
             database=self.database,
         )
 
+    def _build_detector(self) -> None:
+        self.pose_detector = PoseDetector(self.settings)
+
+    def get_pose_detector(self) -> PoseDetector:
+        """Return the detector, waiting for the background warm-up if still running.
+
+        By the time the user starts tracking the warm-up has normally finished,
+        so the join returns immediately.
+        """
+        self._detector_thread.join()
+        if self.pose_detector is None:
+            # Warm-up thread failed; surface the error on the caller's thread
+            self.pose_detector = PoseDetector(self.settings)
+        if not self._detector_applied:
+            self._detector_applied = True
+            self._maybe_apply_adaptive_resolution()
+        return self.pose_detector
+
     def _maybe_apply_adaptive_resolution(self) -> None:
         """Drop to 640×480 when adaptive_resolution is enabled and the MediaPipe pre-warm
         took longer than 100 ms — a reliable proxy for whether this hardware can sustain
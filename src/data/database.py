@@ -3,12 +3,32 @@ from __future__ import annotations
 import csv
 import logging
 import os
+import queue
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from typing import Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued pose records the writer thread folds into one transaction
+_WRITER_BATCH_SIZE = 32
+# How long the writer keeps collecting records after the first one arrives, so
+# short logging intervals still commit in batches rather than once per record
+_WRITER_LINGER_S = 5.0
+# Queued records beyond this are dropped oldest-first if the writer falls behind
+_WRITE_QUEUE_MAXSIZE = 64
+# Landmarks are re-stored only once their mean per-coordinate move exceeds this
+# (normalised image units; 0.002 is about one pixel at 640 px wide)
+_LANDMARK_MIN_MEAN_DELTA = 0.002
+# Upper bound on how much of the database file SQLite may memory-map
+_MMAP_SIZE_BYTES = 64 * 1024 * 1024
+# Rows fetched per round trip when exporting scores to CSV
+_EXPORT_CHUNK_SIZE = 1000
+# Sentinel placed on the write queue to ask the writer thread to exit
+_STOP_WRITER = object()
+
 
 class Database:
     """SQLite persistence for posture scores, landmarks, and dashboard history.
@@ -23,18 +43,41 @@ class Database:
       series for the sparkline widget; persisted when the dashboard is closed and
       reloaded when it reopens.
 
-    Uses WAL journal mode for faster concurrent writes from background threads.
+    Uses WAL journal mode with synchronous=NORMAL, so commits from the writer
+    thread append to the log without an fsync each.
     Pending records are accumulated in memory and flushed in a single transaction
     via _flush() to minimise write amplification.
+
+    queue_pose_data() is the non-blocking entry point for the Qt main thread: it
+    snapshots the landmarks and hands them to a lazily started writer thread, which
+    drains the queue and writes up to _WRITER_BATCH_SIZE records per transaction,
+    waiting up to _WRITER_LINGER_S after the first record for more to arrive.
+    The queue is bounded; if the disk stalls, the oldest unwritten records are
+    dropped so memory use stays flat and the newest readings survive. Queued
+    records always store their score, but their landmark rows are skipped while
+    the pose has barely moved since the last stored set.
+    All connection access is serialised by an internal lock.
     """
 
     def __init__(self, db_path: str, landmark_names: Iterable[str]) -> None:
-        self._conn = sqlite3.connect(db_path)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL")  # faster concurrent writes
+        # In WAL mode NORMAL only syncs at checkpoints; a crash may lose the last
+        # commits but never corrupts the database — fine for periodic samples
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Read stats and exports through a memory map instead of read() syscalls;
+        # virtual address space only, pages are shared with the OS file cache
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE_BYTES}")
         self._cursor = self._conn.cursor()
+        self._lock = threading.Lock()
         self._landmark_names = list(landmark_names)
         self._pending_scores: list[tuple] = []
         self._pending_landmarks: list[tuple] = []
+        self._write_queue: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_MAXSIZE)
+        # Last landmark rows the writer stored, for change detection; only the
+        # writer thread touches it
+        self._last_queued_rows: Optional[list[tuple]] = None
+        self._writer: Optional[threading.Thread] = None
         self._create_tables()
 
     def _create_tables(self) -> None:
@@ -67,19 +110,97 @@ class Database:
         self._conn.commit()
 
     def save_pose_data(self, landmarks, score: float) -> None:
-        timestamp = datetime.now().isoformat()
-        self._pending_scores.append((timestamp, score))
+        record = self._snapshot(landmarks, score)
+        with self._lock:
+            self._stage(record)
+            self._flush()
+
+    def save_pose_data_batch(self, records: list[tuple]) -> None:
+        """Write (timestamp, score, landmark_rows) records in one transaction."""
+        with self._lock:
+            for record in records:
+                self._stage(record)
+            self._flush()
 
+    def queue_pose_data(self, landmarks, score: float) -> None:
+        """Snapshot *landmarks* and write them on the background writer thread."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="DatabaseWriter", daemon=True
+            )
+            self._writer.start()
+        record = self._snapshot(landmarks, score)
+        try:
+            self._write_queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self._write_queue.get_nowait()
+            except queue.Empty:
+                pass
+            logger.warning("Database writer is behind; dropped oldest pose record")
+            self._write_queue.put_nowait(record)
+
+    def _drop_unchanged_landmarks(self, record: tuple) -> tuple:
+        """Blank *record*'s landmark rows if the pose barely moved since the last set."""
+        timestamp, score, rows = record
+        if self._landmarks_unchanged(rows):
+            return timestamp, score, []
+        self._last_queued_rows = rows
+        return record
+
+    def _landmarks_unchanged(self, rows: list[tuple]) -> bool:
+        """True if *rows* are within _LANDMARK_MIN_MEAN_DELTA of the last stored set."""
+        previous = self._last_queued_rows
+        if previous is None or len(previous) != len(rows):
+            return False
+        total = 0.0
+        for (_, x0, y0, z0, _), (_, x1, y1, z1, _) in zip(previous, rows):
+            total += abs(x1 - x0) + abs(y1 - y0) + abs(z1 - z0)
+        return total < _LANDMARK_MIN_MEAN_DELTA * 3 * len(rows)
+
+    def _snapshot(self, landmarks, score: float) -> tuple:
+        """Copy the fields we persist so the caller's landmark object can be reused."""
+        timestamp = datetime.now().isoformat()
+        rows = []
         for landmark_enum in self._landmark_names:
             lm = landmarks.landmark[landmark_enum]
-            self._pending_landmarks.append(
-                (timestamp, landmark_enum.name, lm.x, lm.y, lm.z, lm.visibility)
-            )
+            rows.append((landmark_enum.name, lm.x, lm.y, lm.z, lm.visibility))
+        return timestamp, score, rows
+
+    def _stage(self, record: tuple) -> None:
+        """Append one snapshot to the pending lists; must be called with _lock held."""
+        timestamp, score, rows = record
+        self._pending_scores.append((timestamp, score))
+        self._pending_landmarks.extend((timestamp, *row) for row in rows)
 
-        self._flush()
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._write_queue.get()
+            if item is _STOP_WRITER:
+                return
+            # Change detection runs here rather than in queue_pose_data() so the
+            # comparison loop stays off the caller's (GUI) thread
+            batch = [self._drop_unchanged_landmarks(item)]
+            stop = False
+            deadline = time.monotonic() + _WRITER_LINGER_S
+            while len(batch) < _WRITER_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP_WRITER:
+                    stop = True
+                    break
+                batch.append(self._drop_unchanged_landmarks(item))
+            self.save_pose_data_batch(batch)
+            if stop:
+                return
 
     def _flush(self) -> None:
-        """Write all pending records in a single transaction."""
+        """Write all pending records in a single transaction; requires _lock."""
         if not self._pending_scores and not self._pending_landmarks:
             return
         try:
@@ -102,14 +223,15 @@ class Database:
     def get_recent_stats(self, since_iso: str) -> Optional[dict]:
         """Return aggregate score stats since *since_iso* (ISO-format timestamp)."""
         try:
-            row = self._cursor.execute(
-                """
-                SELECT COUNT(*), AVG(score), MIN(score), MAX(score)
-                FROM posture_scores
-                WHERE timestamp >= ?
-                """,
-                (since_iso,),
-            ).fetchone()
+            with self._lock:
+                row = self._cursor.execute(
+                    """
+                    SELECT COUNT(*), AVG(score), MIN(score), MAX(score)
+                    FROM posture_scores
+                    WHERE timestamp >= ?
+                    """,
+                    (since_iso,),
+                ).fetchone()
             if row and row[0]:
                 return {
                     "count": row[0],
@@ -135,12 +257,21 @@ class Database:
             params = (since_iso,)
         query += " ORDER BY timestamp"
         try:
-            rows = self._cursor.execute(query, params).fetchall()
+            count = 0
             with open(out_path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(["timestamp", "score"])
-                writer.writerows(rows)
-            logger.info("Exported %d score rows to %s", len(rows), out_path)
+                # Stream in chunks rather than materialising the whole table;
+                # the lock stays held because the connection is shared
+                with self._lock:
+                    cursor = self._conn.execute(query, params)
+                    while True:
+                        rows = cursor.fetchmany(_EXPORT_CHUNK_SIZE)
+                        if not rows:
+                            break
+                        writer.writerows(rows)
+                        count += len(rows)
+            logger.info("Exported %d score rows to %s", count, out_path)
             return out_path
         except (sqlite3.Error, OSError):
             logger.exception("Failed to export scores CSV")
@@ -151,7 +282,7 @@ class Database:
         if not scores:
             return
         try:
-            with self._conn:
+            with self._lock, self._conn:
                 self._conn.executemany(
                     "INSERT OR REPLACE INTO dashboard_history (ts, score) VALUES (?, ?)",
                     scores,
@@ -162,18 +293,46 @@ class Database:
     def load_dashboard_history(self, limit: int = 120) -> list[tuple[float, float]]:
         """Return the most recent *limit* (timestamp, score) pairs, oldest first."""
         try:
-            rows = self._cursor.execute(
-                "SELECT ts, score FROM dashboard_history ORDER BY ts DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
+            with self._lock:
+                rows = self._cursor.execute(
+                    "SELECT ts, score FROM dashboard_history ORDER BY ts DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
             return list(reversed(rows))
         except sqlite3.Error:
             logger.exception("Failed to load dashboard history")
             return []
 
+    def load_dashboard_scores(self, limit: int = 120) -> list[float]:
+        """Return the most recent *limit* dashboard scores, oldest first.
+
+        The sparkline only needs the values, so the window is ordered in SQL and
+        the timestamps never reach Python.
+        """
+        try:
+            with self._lock:
+                rows = self._cursor.execute(
+                    """
+                    SELECT score FROM (
+                        SELECT ts, score FROM dashboard_history
+                        ORDER BY ts DESC LIMIT ?
+                    ) ORDER BY ts
+                    """,
+                    (limit,),
+                ).fetchall()
+            return [row[0] for row in rows]
+        except sqlite3.Error:
+            logger.exception("Failed to load dashboard history")
+            return []
+
     def close(self) -> None:
-        self._flush()
-        self._conn.close()
+        if self._writer is not None:
+            self._write_queue.put(_STOP_WRITER)
+            self._writer.join(timeout=5.0)
+            self._writer = None
+        with self._lock:
+            self._flush()
+            self._conn.close()
 
     @property
     def cursor(self):
@@ -1,6 +1,8 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 
 import psutil
@@ -11,11 +13,11 @@ from application import ApplicationFacade
 _LOG_FORMAT = "%(asctime)s %(levelname)-8s %(name)s: %(message)s"
 _LOG_DATE_FMT = "%H:%M:%S"
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=_LOG_FORMAT,
-    datefmt=_LOG_DATE_FMT,
-)
+_formatter = logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FMT)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_formatter)
+_log_handlers = [_stream_handler]
+_setup_warnings = []
 
 # Also persist logs to a rotating file so they survive restarts
 try:
@@ -32,12 +34,27 @@ try:
         backupCount=3,
         encoding="utf-8",
     )
-    _file_handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FMT))
-    logging.getLogger().addHandler(_file_handler)
+    _file_handler.setFormatter(_formatter)
+    _log_handlers.append(_file_handler)
 except OSError as _e:
-    logging.getLogger(__name__).warning("Could not set up log file: %s", _e)
+    _setup_warnings.append(f"Could not set up log file: {_e}")
+
+# Records are formatted and written on a listener thread: the capture and
+# processing threads only enqueue, so a slow console or disk never stalls them
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(
+    level=logging.INFO,
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
 
 logger = logging.getLogger(__name__)
+for _warning in _setup_warnings:
+    logger.warning("%s", _warning)
 
 
 def _kill_existing_instance(lock_file: str) -> None:
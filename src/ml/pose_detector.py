@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import cv2
 import json
@@ -46,6 +46,13 @@ class PoseDetector:
         self.frame_height = runtime.frame_height
         self.mp_pose = mp.solutions.pose
         self.mp_draw = mp.solutions.drawing_utils
+        # Marker and connection styles are fixed, so build them once, not per frame
+        self._landmark_spec = self.mp_draw.DrawingSpec(
+            color=(0, 255, 0), thickness=2, circle_radius=2
+        )
+        self._connection_spec = self.mp_draw.DrawingSpec(
+            color=(255, 255, 255), thickness=2
+        )
         model_complexity = ml_settings.model_complexity
         if ml_settings.enable_gpu:
             # Force highest-complexity model when GPU is requested; MediaPipe Python
@@ -106,8 +113,41 @@ class PoseDetector:
             logger.exception("Unexpected error processing frame")
             return frame, 0.0, None
 
+    def measure_frame(self, frame: np.ndarray) -> Optional[Dict[str, float]]:
+        """Return posture metrics for *frame* without annotating it.
+
+        For callers that only need the numbers, such as calibration, this skips
+        the landmark and feedback drawing done by process_frame(). Like
+        process_frame() it never raises; None means no person was found or the
+        frame could not be processed.
+        """
+        try:
+            results = self._detect_pose(self._preprocess_frame(frame))
+            if not results.pose_landmarks:
+                return None
+            points = np.array(
+                [[lm.x, lm.y, lm.z] for lm in results.pose_landmarks.landmark]
+            )
+            return self._compute_posture_metrics_from_points(points)
+        except (cv2.error, ValueError, np.linalg.LinAlgError) as exc:
+            logger.warning("Skipping frame due to recoverable error: %s", exc)
+            return None
+        except Exception:  # noqa: BLE001 - unexpected error; keep caller alive
+            logger.exception("Unexpected error measuring frame")
+            return None
+
     def _preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
-        frame = cv2.resize(frame, (self.frame_width, self.frame_height))
+        if frame.shape[1] != self.frame_width or frame.shape[0] != self.frame_height:
+            # Cameras usually deliver the configured size already; only scale
+            # once here so the dashboard preview is derived from this frame.
+            # INTER_AREA averages source pixels when shrinking, avoiding the
+            # aliasing bilinear sampling shows at 2x and larger reductions.
+            shrinking = frame.shape[1] > self.frame_width
+            frame = cv2.resize(
+                frame,
+                (self.frame_width, self.frame_height),
+                interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR,
+            )
         lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
         l_channel, a, b = cv2.split(lab)
         l_channel = self._clahe.apply(l_channel)
@@ -125,12 +165,8 @@ class PoseDetector:
             frame,
             results.pose_landmarks,
             self.mp_pose.POSE_CONNECTIONS,
-            landmark_drawing_spec=self.mp_draw.DrawingSpec(
-                color=(0, 255, 0), thickness=2, circle_radius=2
-            ),
-            connection_drawing_spec=self.mp_draw.DrawingSpec(
-                color=(255, 255, 255), thickness=2
-            ),
+            landmark_drawing_spec=self._landmark_spec,
+            connection_drawing_spec=self._connection_spec,
         )
         if results.pose_landmarks:
             h, w, _ = frame.shape
@@ -162,6 +198,21 @@ class PoseDetector:
         dot_product = np.clip(np.dot(v1_norm, v2_norm), -1.0, 1.0)
         return float(np.degrees(np.arccos(dot_product)))
 
+    @staticmethod
+    def _angles_between(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """Row-wise angle_between() for two (N, 3) arrays, in one NumPy pass.
+
+        Uses atan2(|v1 x v2|, v1 . v2), which needs no normalisation or clipping
+        and stays accurate near 0 and 180 degrees where arccos loses precision.
+        """
+        # Same zero-length guard as angle_between(), on squared norms
+        valid = (np.einsum("ij,ij->i", v1, v1) >= 1e-12) & (
+            np.einsum("ij,ij->i", v2, v2) >= 1e-12
+        )
+        cross = np.linalg.norm(np.cross(v1, v2), axis=1)
+        dot_product = np.einsum("ij,ij->i", v1, v2)
+        return np.where(valid, np.degrees(np.arctan2(cross, dot_product)), 0.0)
+
     def calculate_posture_metrics(self, landmarks: Any) -> Dict[str, float]:
         return self._compute_posture_metrics(landmarks)
 
@@ -193,7 +244,12 @@ class PoseDetector:
         head_tilt_score = np.clip(
             1 - abs(nose[2] - mid_ear[2]) * self.score_thresholds["head_tilt"], 0, 1
         )
-        neck_angle = self.angle_between(mid_ear - mid_shoulder, self.ideal_neck_vector)
+        # Neck and spine angles share one vectorised pass instead of two
+        # rounds of scalar norm/dot/arccos calls
+        neck_angle, spine_angle = self._angles_between(
+            np.stack((mid_ear - mid_shoulder, mid_shoulder - mid_hip)),
+            np.stack((self.ideal_neck_vector, self.ideal_spine_vector)),
+        )
         neck_vertical_score = np.clip(
             1 - abs(neck_angle) / self.score_thresholds["neck_angle"], 0, 1
         )
@@ -214,9 +270,6 @@ class PoseDetector:
             ]
         )
 
-        spine_angle = self.angle_between(
-            mid_shoulder - mid_hip, self.ideal_spine_vector
-        )
         spine_alignment_score = np.clip(
             1 - abs(spine_angle) / self.score_thresholds["spine_angle"], 0, 1
         )
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import os
+import sys
 import threading
 import time
 from threading import Event, Thread
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
 
 import cv2
 
@@ -14,48 +16,262 @@ from .settings_service import SettingsService
 logger = logging.getLogger(__name__)
 
 FrameCallback = Callable[[Any], Any]
+FrameListener = Callable[[], None]
+CameraSource = Union[int, str]
+
+# A grab() that returns faster than this handed back a frame that was already
+# queued rather than one it waited for, so it is stale
+_QUEUED_GRAB_S = 0.002
+# Upper bound on queued frames skipped before one is decoded
+_MAX_DRAINED_FRAMES = 4
+_DROP_LOG_INTERVAL_S = 5.0
+# Decode buffers reused by the capture thread: one may sit in the mailbox and
+# one be processed, which always leaves a third free to decode into
+_FRAME_POOL_SIZE = 3
+# Consecutive callback failures before it is bypassed, and for how long
+_MAX_CALLBACK_ERRORS = 5
+_CALLBACK_COOLDOWN_S = 5.0
+
+
+# The platform's native capture backend. Naming it skips OpenCV trying every
+# compiled backend in turn, and these are the ones that honour the buffer-size
+# and FPS requests made after opening.
+if sys.platform.startswith("linux"):
+    NATIVE_BACKEND = cv2.CAP_V4L2
+elif sys.platform == "darwin":
+    NATIVE_BACKEND = cv2.CAP_AVFOUNDATION
+elif sys.platform == "win32":
+    NATIVE_BACKEND = cv2.CAP_DSHOW
+else:
+    NATIVE_BACKEND = cv2.CAP_ANY
+
+
+def gstreamer_pipeline(
+    device: str = "/dev/video0", fps: int = 30, width: int = 640, height: int = 480
+) -> str:
+    """Return a V4L2 GStreamer pipeline for CameraService.start(source=...).
+
+    The appsink keeps a single buffer and drops older ones, the GStreamer
+    equivalent of CAP_PROP_BUFFERSIZE=1. Requires OpenCV built with GStreamer.
+    """
+    return (
+        f"v4l2src device={device} ! "
+        f"video/x-raw,framerate={fps}/1,width={width},height={height} ! "
+        "videoconvert ! video/x-raw,format=BGR ! "
+        "appsink drop=true max-buffers=1 sync=false"
+    )
+
+
+def _open_capture(source: CameraSource, backend: int) -> cv2.VideoCapture:
+    """Open a device index with *backend* or a pipeline string with GStreamer.
+
+    Device indices fall back to OpenCV's automatic backend choice if the
+    requested backend cannot open them.
+    """
+    if isinstance(source, str):
+        return cv2.VideoCapture(source, cv2.CAP_GSTREAMER)
+    capture = cv2.VideoCapture(source, backend)
+    if not capture.isOpened() and backend != cv2.CAP_ANY:
+        capture.release()
+        capture = cv2.VideoCapture(source)
+    return capture
+
+
+def _fit_preview(frame, size: Tuple[int, int]):
+    """Downscale *frame* to fit within *size*, keeping its aspect ratio."""
+    target_w, target_h = size
+    h, w = frame.shape[:2]
+    scale = min(target_w / w, target_h / h)
+    if scale >= 1.0:
+        return frame
+    # INTER_AREA avoids aliasing on large reductions; for mild ones bilinear looks
+    # the same and is noticeably cheaper.
+    interpolation = cv2.INTER_AREA if scale <= 0.5 else cv2.INTER_LINEAR
+    return cv2.resize(
+        frame,
+        (max(int(w * scale), 1), max(int(h * scale), 1)),
+        interpolation=interpolation,
+    )
 
 
 class CameraService:
-    """Background camera reader that streams frames via callback."""
+    """Background camera reader that streams frames via callback.
+
+    Capture and processing run on separate threads joined by a single-slot
+    mailbox: the capture thread grabs and decodes frames and overwrites the
+    slot, and the processing thread runs the callback on whatever frame is
+    newest. Decoding overlaps inference, and frames that arrive while the
+    callback is busy are replaced rather than queued.
+
+    Threads rather than processes are deliberate: grab/retrieve, the OpenCV
+    preprocessing and MediaPipe's graph all release the GIL inside their
+    native code, so the two threads already run in parallel, and the pose
+    results the GUI consumes are MediaPipe protobufs that would have to be
+    serialised back from a worker process every frame.
+    """
 
-    def __init__(self, settings: SettingsService) -> None:
+    def __init__(
+        self,
+        settings: SettingsService,
+        fourcc: Optional[str] = None,
+        cpu_affinity: Optional[int] = None,
+        cv_threads: Optional[int] = None,
+        backend: Optional[int] = None,
+    ) -> None:
+        """*fourcc* optionally requests a capture format such as ``"MJPG"``.
+
+        Compressed MJPEG keeps USB bandwidth low at high resolutions, and its
+        decode is usually cheaper than moving raw YUYV frames; left unset the
+        driver's default format is used. *cpu_affinity* optionally pins the
+        capture thread to one CPU (Linux only) so it isn't migrated between
+        cores, which steadies frame timing on busy machines. *cv_threads* caps
+        OpenCV's internal worker pool (default: half the CPUs) so resize and
+        colour conversions in the pipeline don't oversubscribe the cores the
+        pose model and GUI also need. *backend* overrides the capture backend
+        (default: NATIVE_BACKEND for this platform).
+        """
         self._settings = settings
+        self._fourcc = fourcc
+        self._cpu_affinity = cpu_affinity
+        self._backend = NATIVE_BACKEND if backend is None else backend
+        self._cv_threads = (
+            cv_threads if cv_threads is not None else max(1, (os.cpu_count() or 2) // 2)
+        )
         self._camera_id = settings.runtime.default_camera_id
         self._fps = settings.runtime.default_fps
         self._frame_time = 1 / max(self._fps, 1)
+        # True once the driver confirms it delivers at _fps; grab() then does
+        # all the pacing and the loop skips its own deadline check
+        self._hw_paced = False
+        # Set by reload_settings(); the capture thread, which owns the
+        # VideoCapture, applies the new rate to the driver between grabs
+        self._renegotiate_fps = False
         self._cap: Optional[cv2.VideoCapture] = None
-        self._is_running = Event()
+        # Polled by both loops every frame; a plain attribute is enough since
+        # nothing waits on it, and stop() wakes the loops through the events below
+        self._running = False
         self._paused = Event()
+        # Set by stop() so waits inside the capture loop return immediately
+        self._stop_requested = Event()
         self._thread: Optional[Thread] = None
+        self._processor: Optional[Thread] = None
+        # Newest decoded frame not yet taken by the processing thread, and the
+        # pool slots it and the frame being processed occupy (guarded by
+        # _mailbox_lock) so the capture thread never decodes over either
+        self._mailbox = None
+        self._mailbox_slot: Optional[int] = None
+        self._processing_slot: Optional[int] = None
+        self._frame_pool: list = [None] * _FRAME_POOL_SIZE
+        self._mailbox_lock = threading.Lock()
+        self._frame_ready = Event()
+        # Held while the callback runs, so pause_processing() can wait it out
+        self._process_lock = threading.Lock()
         self._callback: Optional[FrameCallback] = None
-        self._latest_frame = None
-        self._latest_score = 0.0
-        self._latest_pose_results = None
+        self._frame_listener: Optional[FrameListener] = None
+        # (frame, score, pose results, preview, sequence) from one processed
+        # frame. It is replaced as a whole with a single reference store, which
+        # is atomic under the GIL, so readers never see fields from different
+        # frames and need no lock. The sequence counts published frames, so
+        # consumers polling at their own cadence can tell whether anything is
+        # new without keeping the previous frame alive to compare against.
+        self._latest: Tuple[Any, float, Any, Any, int] = (None, 0.0, None, None, 0)
+        # Display size requested by the dashboard; None when nothing is shown
+        self._preview_size: Optional[Tuple[int, int]] = None
         self._lock = threading.Lock()
+        self._dropped_frames = 0
+        self._callback_errors = 0
+        # Monotonic time until which a repeatedly failing callback is skipped
+        self._callback_resume_at = 0.0
 
-    def start(self, callback: Optional[FrameCallback] = None) -> bool:
-        if self._is_running.is_set():
+    def start(
+        self,
+        callback: Optional[FrameCallback] = None,
+        source: Optional[CameraSource] = None,
+    ) -> bool:
+        """Open the camera and start the capture and processing threads.
+
+        *source* overrides the configured camera id; a string is opened as a
+        GStreamer pipeline (see gstreamer_pipeline()), which lets Linux devices
+        skip the generic V4L2 backend's extra frame copy.
+        """
+        if self._running:
             return False
         self._callback = callback
-        self._cap = cv2.VideoCapture(self._camera_id)
+        self._callback_errors = 0
+        self._callback_resume_at = 0.0
+        self._stop_requested.clear()
+        if source is None:
+            source = self._camera_id
+        self._cap = _open_capture(source, self._backend)
         if not self._cap.isOpened():
-            logger.error("Failed to open camera %s", self._camera_id)
+            logger.error("Failed to open camera %s", source)
+            self._cap.release()
+            self._cap = None
             return False
-        self._is_running.set()
+        # Process-wide; applied here so it only takes effect once tracking runs
+        cv2.setNumThreads(self._cv_threads)
+        if not isinstance(source, str):
+            # Pipelines fix their own caps; devices get the format and size here
+            self._request_frame_format()
+        # Keep only the newest frame queued so detection never runs on a backlog
+        # of stale frames. Backends without the property (MSMF, AVFoundation)
+        # reject it; grab() then keeps their queue drained instead.
+        if not self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            logger.debug("Camera backend ignored CAP_PROP_BUFFERSIZE")
+        self._negotiate_fps()
+        self._renegotiate_fps = False
+        self._running = True
+        self._mailbox = None
+        self._mailbox_slot = self._processing_slot = None
+        self._frame_ready.clear()
+        self._processor = Thread(
+            target=self._processing_loop, name="camera-processing", daemon=True
+        )
+        self._processor.start()
         self._thread = Thread(target=self._capture_loop, daemon=True)
         self._thread.start()
-        logger.info("Camera %s started at %d FPS", self._camera_id, self._fps)
+        logger.info("Camera %s started at %d FPS", source, self._fps)
         return True
 
+    def __enter__(self) -> "CameraService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop capture deterministically when used as ``with CameraService(...)``."""
+        self.stop()
+
+    def set_frame_listener(self, listener: Optional[FrameListener]) -> None:
+        """Register *listener* to be called from the capture thread per new frame.
+
+        The listener must be cheap and thread-safe (e.g. emitting a Qt signal);
+        consumers then read the frame via get_latest_update().
+        """
+        self._frame_listener = listener
+
+    def set_preview_size(self, size: Optional[Tuple[int, int]]) -> None:
+        """Ask the capture thread to also produce frames fitted to *size* pixels.
+
+        Scaling then happens off the GUI thread; pass None to stop producing
+        previews when no view is open.
+        """
+        self._preview_size = size
+
     def stop(self) -> None:
-        self._is_running.clear()
-        if self._thread and self._thread != threading.current_thread():
-            self._thread.join(timeout=2.0)
+        self._stop_requested.set()
+        self._running = False
+        # Wake the processing thread so it sees the stop instead of waiting
+        self._frame_ready.set()
+        current = threading.current_thread()
+        for thread in (self._thread, self._processor):
+            if thread and thread != current:
+                thread.join(timeout=2.0)
         if self._cap:
             self._cap.release()
         self._cap = None
         self._thread = None
+        self._processor = None
+        self._mailbox = None
+        self._frame_pool = [None] * _FRAME_POOL_SIZE
         logger.info("Camera stopped")
 
     def reload_settings(self) -> None:
@@ -64,6 +280,39 @@ class CameraService:
             self._camera_id = runtime.default_camera_id
             self._fps = runtime.default_fps
             self._frame_time = 1 / max(self._fps, 1)
+            # OpenCV captures are not safe to use from two threads, and the
+            # capture thread may be blocked in grab() right now
+            self._renegotiate_fps = True
+
+    def _request_frame_format(self) -> None:
+        """Ask the driver for the configured frame size (and FOURCC, if set).
+
+        Delivering frames at the size the detector works at lets the detector
+        skip its own resize, and a smaller sensor mode also costs less to
+        transfer and decode. Drivers pick the nearest mode they support.
+        """
+        code = cv2.VideoWriter_fourcc(*self._fourcc) if self._fourcc else None
+        if code is not None:
+            self._cap.set(cv2.CAP_PROP_FOURCC, code)
+        # V4L2 renegotiates the format on a size change, so the size goes after
+        # the format for both requests to stick
+        runtime = self._settings.runtime
+        self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, runtime.frame_width)
+        self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, runtime.frame_height)
+        if code is not None and int(self._cap.get(cv2.CAP_PROP_FOURCC)) != code:
+            logger.info("Camera did not accept the %s capture format", self._fourcc)
+
+    def _negotiate_fps(self) -> None:
+        """Ask the driver for the configured rate and drop software pacing if it agrees.
+
+        When the camera delivers at the requested FPS every grabbed frame is
+        processed. Drivers that ignore CAP_PROP_FPS (or report 0) keep running at
+        their native rate, and the loop then decodes only the frames due at the
+        configured FPS, which stays the processing-rate cap.
+        """
+        self._cap.set(cv2.CAP_PROP_FPS, self._fps)
+        reported = self._cap.get(cv2.CAP_PROP_FPS)
+        self._hw_paced = reported > 0 and abs(reported - self._fps) < 1.0
 
     @contextlib.contextmanager
     def pause_processing(self) -> Iterator[None]:
@@ -72,9 +321,13 @@ class CameraService:
         Use this when reloading settings (fps, resolution, camera ID) or
         reloading ScoreService state during live tracking. The method:
 
-        1. Sets the _paused event so the loop idles at the top of its next iteration.
-        2. Acquires-then-releases the frame lock to wait for any active callback
-           invocation to finish (process_frame is infallible, so this resolves quickly).
+        1. Sets the _paused event so both loops idle at the top of their next
+           iteration. The capture thread may still be finishing a grab; it is
+           the only thread that touches the VideoCapture, so reload_settings()
+           just records the new values for it to apply.
+        2. Acquires-then-releases the processing lock to wait for any active
+           callback invocation to finish (process_frame is infallible, so this
+           resolves quickly).
         3. Yields — callers may safely mutate shared state here.
         4. Clears _paused on exit, resuming normal capture.
 
@@ -86,41 +339,117 @@ class CameraService:
         """
         self._paused.set()
         # Acquire and immediately release the lock to wait for any active callback
-        with self._lock:
+        with self._process_lock:
             pass
         try:
             yield
         finally:
             self._paused.clear()
 
+    def _drain_queued_frames(self) -> int:
+        """Skip frames the driver had already queued so the next retrieve() is current.
+
+        Queued frames come back from grab() almost instantly; the drain stops at
+        the first grab that had to wait for the camera, which is the newest frame.
+        """
+        dropped = 0
+        while dropped < _MAX_DRAINED_FRAMES:
+            started = time.monotonic()
+            if not self._cap.grab():
+                break
+            dropped += 1
+            if time.monotonic() - started > _QUEUED_GRAB_S:
+                break
+        return dropped
+
+    def _pin_capture_thread(self) -> None:
+        if self._cpu_affinity is None or not hasattr(os, "sched_setaffinity"):
+            return
+        try:
+            # pid 0 is the calling thread on Linux
+            os.sched_setaffinity(0, {self._cpu_affinity})
+        except OSError as exc:
+            logger.warning(
+                "Could not pin capture thread to CPU %s: %s", self._cpu_affinity, exc
+            )
+
     def _capture_loop(self) -> None:
-        while self._is_running.is_set():
-            if self._paused.is_set():
-                time.sleep(0.01)
+        self._pin_capture_thread()
+        cap = self._cap
+        if cap is None:
+            return
+        # Bound once: looked up several times per frame and fixed for the life
+        # of this loop (a new start() runs a new loop)
+        grab, retrieve = cap.grab, cap.retrieve
+        monotonic = time.monotonic
+        paused, stop_requested = self._paused, self._stop_requested
+        mailbox_lock, frame_ready = self._mailbox_lock, self._frame_ready
+        frame_pool = self._frame_pool
+        # Deadline for the next frame to decode. It advances by whole frame
+        # intervals, so frames landing slightly early or late against it don't
+        # erode the long-run rate the way "time since last frame" checks do.
+        next_due = monotonic()
+        next_drop_log = next_due + _DROP_LOG_INTERVAL_S
+        while self._running:
+            if paused.is_set():
+                stop_requested.wait(0.01)
                 continue
 
-            start_time = time.time()
             try:
-                if self._cap is None:
+                # reload_settings() only assigns plain attributes (atomic under
+                # the GIL) and leaves the driver call to this thread, so a
+                # reload is picked up here at the next frame boundary.
+                if self._renegotiate_fps:
+                    self._renegotiate_fps = False
+                    self._negotiate_fps()
+                hw_paced = self._hw_paced
+                frame_time = self._frame_time
+                # grab() blocks at the camera's rate and keeps the driver queue
+                # drained; only frames due for processing pay for the decode.
+                grab_started = monotonic()
+                if not grab():
+                    logger.warning("Failed to read frame from camera; stopping capture")
+                    self.stop()
                     break
-                ret, frame = self._cap.read()
+                now = monotonic()
+                if not hw_paced:
+                    if now < next_due:
+                        continue
+                    next_due += frame_time
+                    if now - next_due > frame_time:
+                        # Fell well behind (paused, slow camera); resync, don't burst
+                        next_due = now + frame_time
+                if now - grab_started <= _QUEUED_GRAB_S:
+                    # Frames piled up while the last one was processed
+                    self._dropped_frames += self._drain_queued_frames()
+                    if now >= next_drop_log:
+                        next_drop_log = now + _DROP_LOG_INTERVAL_S
+                        if self._dropped_frames:
+                            logger.debug(
+                                "Skipped %d stale camera frames", self._dropped_frames
+                            )
+                            self._dropped_frames = 0
+                with mailbox_lock:
+                    busy = (self._mailbox_slot, self._processing_slot)
+                slot = 0
+                while slot in busy:
+                    slot += 1
+                buffer = frame_pool[slot]
+                # Decoding into a pooled buffer avoids a fresh multi-megabyte
+                # allocation per frame; OpenCV reallocates only on a size change
+                if buffer is None:
+                    ret, frame = retrieve()
+                else:
+                    ret, frame = retrieve(buffer)
                 if not ret:
-                    logger.warning("Failed to read frame from camera; stopping capture")
+                    logger.warning("Failed to decode camera frame; stopping capture")
                     self.stop()
                     break
-
-                latest_score = 0.0
-                pose_results = None
-                # process_frame is already infallible (returns (frame, 0.0, None) on error)
-                if self._callback:
-                    processed = self._callback(frame)
-                    if isinstance(processed, tuple) and len(processed) == 3:
-                        frame, latest_score, pose_results = processed
-
-                with self._lock:
-                    self._latest_frame = frame
-                    self._latest_score = latest_score
-                    self._latest_pose_results = pose_results
+                frame_pool[slot] = frame
+                with mailbox_lock:
+                    self._mailbox = frame
+                    self._mailbox_slot = slot
+                frame_ready.set()
 
             except (cv2.error, OSError) as exc:
                 logger.error("Camera I/O error in capture loop; stopping: %s", exc)
@@ -131,17 +460,107 @@ class CameraService:
                 self.stop()
                 break
 
-            processing_time = time.time() - start_time
-            # _frame_time is a float; CPython's GIL makes this read atomic.
-            # reload_settings() only runs while _paused is set (loop is idle),
-            # so this never races with a live capture iteration.
-            if processing_time < self._frame_time:
-                time.sleep(self._frame_time - processing_time)
+    def _processing_loop(self) -> None:
+        # Bound once: these are touched on every frame and never replaced
+        frame_ready = self._frame_ready
+        mailbox_lock = self._mailbox_lock
+        process_lock = self._process_lock
+        paused = self._paused
+        process = self._process
+        while self._running:
+            frame_ready.wait()
+            if not self._running:
+                break
+            # The previous frame's slot stays reserved until the next one is
+            # taken, saving a second lock round trip per frame; with three
+            # buffers the capture thread still always has one free.
+            with mailbox_lock:
+                frame, self._mailbox = self._mailbox, None
+                self._processing_slot, self._mailbox_slot = self._mailbox_slot, None
+                frame_ready.clear()
+            if frame is None:
+                continue
+            try:
+                with process_lock:
+                    if paused.is_set():
+                        continue
+                    process(frame)
+            except Exception:  # noqa: BLE001
+                logger.exception("Unexpected error processing frame; stopping")
+                self.stop()
+                break
+
+    def _process(self, frame) -> None:
+        """Run the callback on *frame* and publish the results to readers."""
+        pooled = frame
+        latest_score = 0.0
+        pose_results = None
+        # process_frame is already infallible (returns (frame, 0.0, None) on
+        # error); other callbacks that raise are contained here
+        if self._callback and not self._callback_suspended():
+            try:
+                processed = self._callback(frame)
+            except Exception:  # noqa: BLE001 - keep capturing; publish the raw frame
+                logger.exception("Frame callback failed")
+                self._record_callback_error()
+            else:
+                self._callback_errors = 0
+                if isinstance(processed, tuple) and len(processed) == 3:
+                    frame, latest_score, pose_results = processed
+        if frame is pooled:
+            # Readers keep the published frame past this call; detach it from
+            # the buffer the capture thread is about to decode into again
+            frame = frame.copy()
+
+        preview_size = self._preview_size
+        preview = _fit_preview(frame, preview_size) if preview_size else None
+
+        sequence = self._latest[4] + 1
+        self._latest = (frame, latest_score, pose_results, preview, sequence)
+
+        listener = self._frame_listener
+        if listener is not None:
+            listener()
+
+    def _callback_suspended(self) -> bool:
+        return bool(self._callback_resume_at) and (
+            time.monotonic() < self._callback_resume_at
+        )
+
+    def _record_callback_error(self) -> None:
+        """Count a callback failure; bypass the callback for a while after a run."""
+        self._callback_errors += 1
+        if self._callback_errors < _MAX_CALLBACK_ERRORS:
+            return
+        logger.warning(
+            "Frame callback failed %d times in a row; pausing it for %.0f s",
+            self._callback_errors,
+            _CALLBACK_COOLDOWN_S,
+        )
+        self._callback_errors = 0
+        self._callback_resume_at = time.monotonic() + _CALLBACK_COOLDOWN_S
 
     def get_latest_frame(self):
-        with self._lock:
-            return self._latest_frame, self._latest_score
+        frame, score = self._latest[:2]
+        return frame, score
+
+    def get_latest_update(self):
+        """Return (frame, score, pose results) from the same processed frame."""
+        return self._latest[:3]
+
+    def get_latest_preview(self):
+        """Return the latest display-sized frame, or the full frame if none."""
+        return self.get_preview_snapshot()[1]
+
+    def get_preview_snapshot(self) -> Tuple[int, Any]:
+        """Return (sequence, preview) for the latest frame, read together.
+
+        The sequence increases with every published frame; a caller that saw
+        the same number before already has this preview.
+        """
+        frame, _, _, preview, sequence = self._latest
+        return sequence, preview if preview is not None else frame
 
     def get_latest_pose_results(self):
-        with self._lock:
-            return self._latest_pose_results
+        """Return the latest PoseDetectionResult, or None if no person was found."""
+        return self._latest[2]
@@ -8,6 +8,10 @@ import numpy as np
 
 from .settings_service import SettingsService
 
+# Timestamps are float32 offsets from a base time; rebasing once offsets pass
+# this keeps their resolution under 10 ms
+_REBASE_AFTER_S = 100_000.0
+
 
 class ScoreService:
     """Thread-safe rolling buffer for posture scores with session statistics and streak tracking.
@@ -17,16 +21,43 @@ class ScoreService:
     session_stats() are read from the Qt main thread.
     """
 
+    # Read on every frame from both threads; slots skip the instance dict lookups
+    __slots__ = (
+        "_lock",
+        "_buffer_size",
+        "_t0",
+        "_timestamps",
+        "_scores",
+        "_timestamp_items",
+        "_score_items",
+        "_current_index",
+        "_is_full",
+        "_window_size",
+        "_threshold",
+        "_window_tail",
+        "_window_count",
+        "_window_sum",
+        "_session_start",
+        "_streak_start",
+        "_best_streak_s",
+    )
+
     def __init__(self, settings: SettingsService) -> None:
         ml_settings = settings.ml
         self._lock = threading.Lock()
         self._buffer_size = ml_settings.score_buffer_size
-        self._timestamps = np.zeros(self._buffer_size, dtype=np.float64)
-        self._scores = np.zeros(self._buffer_size, dtype=np.float32)
+        # Seconds since _t0, in float32 to halve the buffer the window scans read
+        self._t0 = monotonic()
+        self._allocate_buffers_unsafe()
         self._current_index = 0
         self._is_full = False
         self._window_size = ml_settings.score_window_size
         self._threshold = ml_settings.score_threshold
+        # Running sum over the default window: the newest _window_count entries,
+        # oldest at _window_tail. Evicted as they age out or are overwritten.
+        self._window_tail = 0
+        self._window_count = 0
+        self._window_sum = 0.0
         self._session_start: Optional[float] = None
         # Streak: consecutive seconds the rolling average has been above threshold
         self._streak_start: Optional[float] = None
@@ -50,23 +81,33 @@ class ScoreService:
         with self._lock:
             return max(self._best_streak_s, self._current_streak_s_unsafe())
 
-    def _current_streak_s_unsafe(self) -> float:
+    def _current_streak_s_unsafe(self, now: Optional[float] = None) -> float:
         """Return current streak duration; must be called with self._lock held."""
         if self._streak_start is None:
             return 0.0
-        return monotonic() - self._streak_start
+        return (monotonic() if now is None else now) - self._streak_start
 
     def reload(self, settings: SettingsService) -> None:
         ml_settings = settings.ml
         with self._lock:
             if ml_settings.score_buffer_size != self._buffer_size:
                 self._buffer_size = ml_settings.score_buffer_size
-                self._timestamps = np.zeros(self._buffer_size, dtype=np.float64)
-                self._scores = np.zeros(self._buffer_size, dtype=np.float32)
+                self._allocate_buffers_unsafe()
                 self._current_index = 0
                 self._is_full = False
             self._window_size = ml_settings.score_window_size
             self._threshold = ml_settings.score_threshold
+            self._rebuild_window_unsafe()
+
+    def _allocate_buffers_unsafe(self) -> None:
+        """(Re)create the score ring buffers for the current _buffer_size."""
+        self._timestamps = np.zeros(self._buffer_size, dtype=np.float32)
+        self._scores = np.zeros(self._buffer_size, dtype=np.float32)
+        # Per-score stores and window reads touch one element at a time. Buffer
+        # views index as plain Python floats, skipping ndarray scalar dispatch
+        # while the arrays stay available for the vectorised scans.
+        self._timestamp_items = memoryview(self._timestamps)
+        self._score_items = memoryview(self._scores)
 
     def reset_session(self) -> None:
         """Mark the start of a new tracking session and reset streaks."""
@@ -89,26 +130,42 @@ class ScoreService:
                     self._best_streak_s = elapsed
                 self._streak_start = None
 
-    def add_score(self, score: float) -> None:
+    def add_score(self, score: float) -> float:
+        """Record a score and return the updated rolling average."""
         with self._lock:
+            # One clock read per score, shared by the buffer, streak and average
+            now = monotonic()
             if self._session_start is None:
-                self._session_start = monotonic()
-            current_time = monotonic()
-            self._timestamps[self._current_index] = current_time
-            self._scores[self._current_index] = score
-            self._current_index = (self._current_index + 1) % self._buffer_size
+                self._session_start = now
+            offset = now - self._t0
+            if offset > _REBASE_AFTER_S:
+                self._t0 += offset
+                self._timestamps -= np.float32(offset)
+                offset = 0.0
+            index = self._current_index
+            if self._window_count == self._buffer_size:
+                # The slot about to be overwritten is still inside the window
+                self._evict_oldest_unsafe()
+            self._timestamp_items[index] = offset
+            scores = self._score_items
+            scores[index] = score
+            # Read back the stored float32 so evictions subtract the same value
+            self._window_sum += scores[index]
+            self._window_count += 1
+            self._current_index = (index + 1) % self._buffer_size
             if self._current_index == 0:
                 self._is_full = True
-            self._update_streak_unsafe(score)
+            self._update_streak_unsafe(score, now)
+            return self._average_unsafe(now=now)
 
-    def _update_streak_unsafe(self, score: float) -> None:
+    def _update_streak_unsafe(self, score: float, now: float) -> None:
         """Update streak state; must be called with self._lock held."""
         if score >= self._threshold:
             if self._streak_start is None:
-                self._streak_start = monotonic()
+                self._streak_start = now
         else:
             if self._streak_start is not None:
-                elapsed = monotonic() - self._streak_start
+                elapsed = now - self._streak_start
                 if elapsed > self._best_streak_s:
                     self._best_streak_s = elapsed
             self._streak_start = None
@@ -117,13 +174,43 @@ class ScoreService:
         with self._lock:
             return self._average_unsafe(window_seconds)
 
-    def _average_unsafe(self, window_seconds: Optional[int] = None) -> float:
-        """Compute rolling average; must be called with self._lock held."""
+    def _evict_oldest_unsafe(self) -> None:
+        """Drop the oldest entry from the running window; requires self._lock."""
+        self._window_sum -= self._score_items[self._window_tail]
+        self._window_tail = (self._window_tail + 1) % self._buffer_size
+        self._window_count -= 1
+        if not self._window_count:
+            # Start from an exact zero so rounding drift never accumulates
+            self._window_sum = 0.0
+
+    def _rebuild_window_unsafe(self) -> None:
+        """Recount the running window from the buffer after a settings change."""
+        filled = self._buffer_size if self._is_full else self._current_index
+        self._window_tail = (self._current_index - filled) % self._buffer_size
+        self._window_count = filled
+        # Every filled slot is in the count; the next query evicts expired ones
+        self._window_sum = float(self._scores[:filled].sum(dtype=np.float64))
+
+    def _average_unsafe(
+        self, window_seconds: Optional[int] = None, now: Optional[float] = None
+    ) -> float:
+        """Compute rolling average; must be called with self._lock held.
+
+        The default window is served from the running sum in amortised O(1);
+        other windows fall back to a scan of the buffer.
+        """
         window = window_seconds or self._window_size
-        current_time = monotonic()
+        offset = (monotonic() if now is None else now) - self._t0
+        if window == self._window_size:
+            stamps = self._timestamp_items
+            while self._window_count and offset - stamps[self._window_tail] > window:
+                self._evict_oldest_unsafe()
+            if not self._window_count:
+                return 0.0
+            return self._window_sum / self._window_count
         if not self._is_full and self._current_index == 0:
             return 0.0
-        valid_mask = current_time - self._timestamps <= window
+        valid_mask = offset - self._timestamps <= window
         if self._is_full:
             valid_scores = self._scores[valid_mask]
         else:
@@ -132,10 +219,18 @@ class ScoreService:
             ]
         return float(np.mean(valid_scores)) if len(valid_scores) else 0.0
 
+    def _session_cutoff_unsafe(self) -> float:
+        """Session start as a timestamp offset; requires self._lock."""
+        if self._session_start is None:
+            return -np.inf
+        # Rounded like the stored offsets, so the session's first score is kept
+        return float(np.float32(self._session_start - self._t0))
+
     def average_and_stats(self) -> tuple:
         """Return (rolling_average, session_stats_dict) in a single lock acquisition."""
         with self._lock:
-            avg = self._average_unsafe()
+            now = monotonic()
+            avg = self._average_unsafe(now=now)
             if not self._is_full and self._current_index == 0:
                 return avg, {
                     "count": 0,
@@ -146,7 +241,7 @@ class ScoreService:
                     "best_streak_s": 0.0,
                     "current_streak_s": 0.0,
                 }
-            cutoff = self._session_start if self._session_start is not None else 0.0
+            cutoff = self._session_cutoff_unsafe()
             if self._is_full:
                 mask = self._timestamps >= cutoff
                 scores = self._scores[mask]
@@ -164,9 +259,9 @@ class ScoreService:
                     "best_streak_s": 0.0,
                     "current_streak_s": 0.0,
                 }
-            duration = monotonic() - self._session_start if self._session_start else 0.0
-            best = max(self._best_streak_s, self._current_streak_s_unsafe())
-            current = self._current_streak_s_unsafe()
+            duration = now - self._session_start if self._session_start else 0.0
+            current = self._current_streak_s_unsafe(now)
+            best = max(self._best_streak_s, current)
             return avg, {
                 "count": int(len(scores)),
                 "avg": float(round(np.mean(scores), 1)),
@@ -191,7 +286,7 @@ class ScoreService:
                     "current_streak_s": 0.0,
                 }
 
-            cutoff = self._session_start if self._session_start is not None else 0.0
+            cutoff = self._session_cutoff_unsafe()
 
             if self._is_full:
                 mask = self._timestamps >= cutoff
@@ -213,9 +308,10 @@ class ScoreService:
                     "current_streak_s": 0.0,
                 }
 
-            duration = monotonic() - self._session_start if self._session_start else 0.0
-            best = max(self._best_streak_s, self._current_streak_s_unsafe())
-            current = self._current_streak_s_unsafe()
+            now = monotonic()
+            duration = now - self._session_start if self._session_start else 0.0
+            current = self._current_streak_s_unsafe(now)
+            best = max(self._best_streak_s, current)
             return {
                 "count": int(len(scores)),
                 "avg": float(round(np.mean(scores), 1)),
@@ -5,6 +5,7 @@ import os
 import sys
 import tempfile
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field, fields
 from typing import (
@@ -16,15 +17,18 @@ from typing import (
     MutableMapping,
     Optional,
     Tuple,
+    TYPE_CHECKING,
     Type,
     get_args,
     get_origin,
     get_type_hints,
 )
 
-import mediapipe as mp
 from PyQt6.QtCore import QSettings
 
+if TYPE_CHECKING:
+    import mediapipe as mp
+
 
 SETTINGS_SCHEMA_VERSION = "1.1.0"
 SETTINGS_ORGANIZATION = "BatesPosture"
@@ -158,29 +162,54 @@ class UserProfileSettings:
     language_code: str = "en_US"
 
 
+# MediaPipe PoseLandmark indices (stable across releases). Kept as plain ints so
+# importing settings doesn't pull in mediapipe; get_posture_landmarks() resolves
+# them to enum members on first use.
 POSTURE_LANDMARKS = [
-    mp.solutions.pose.PoseLandmark.NOSE,
-    mp.solutions.pose.PoseLandmark.LEFT_EYE_INNER,
-    mp.solutions.pose.PoseLandmark.LEFT_EYE,
-    mp.solutions.pose.PoseLandmark.LEFT_EYE_OUTER,
-    mp.solutions.pose.PoseLandmark.RIGHT_EYE_INNER,
-    mp.solutions.pose.PoseLandmark.RIGHT_EYE,
-    mp.solutions.pose.PoseLandmark.RIGHT_EYE_OUTER,
-    mp.solutions.pose.PoseLandmark.LEFT_EAR,
-    mp.solutions.pose.PoseLandmark.RIGHT_EAR,
-    mp.solutions.pose.PoseLandmark.MOUTH_LEFT,
-    mp.solutions.pose.PoseLandmark.MOUTH_RIGHT,
-    mp.solutions.pose.PoseLandmark.LEFT_SHOULDER,
-    mp.solutions.pose.PoseLandmark.RIGHT_SHOULDER,
-    mp.solutions.pose.PoseLandmark.LEFT_ELBOW,
-    mp.solutions.pose.PoseLandmark.RIGHT_ELBOW,
-    mp.solutions.pose.PoseLandmark.LEFT_WRIST,
-    mp.solutions.pose.PoseLandmark.RIGHT_WRIST,
-    mp.solutions.pose.PoseLandmark.LEFT_HIP,
-    mp.solutions.pose.PoseLandmark.RIGHT_HIP,
+    0,  # NOSE
+    1,  # LEFT_EYE_INNER
+    2,  # LEFT_EYE
+    3,  # LEFT_EYE_OUTER
+    4,  # RIGHT_EYE_INNER
+    5,  # RIGHT_EYE
+    6,  # RIGHT_EYE_OUTER
+    7,  # LEFT_EAR
+    8,  # RIGHT_EAR
+    9,  # MOUTH_LEFT
+    10,  # MOUTH_RIGHT
+    11,  # LEFT_SHOULDER
+    12,  # RIGHT_SHOULDER
+    13,  # LEFT_ELBOW
+    14,  # RIGHT_ELBOW
+    15,  # LEFT_WRIST
+    16,  # RIGHT_WRIST
+    23,  # LEFT_HIP
+    24,  # RIGHT_HIP
 ]
 
 
+@lru_cache(maxsize=None)
+def _field_types(section_cls: Type[Any]) -> Dict[str, Any]:
+    """Resolved annotation per field of a settings dataclass, in field order.
+
+    get_type_hints() re-evaluates the string annotations on every call, so each
+    section class is inspected once and shared by load, save and update.
+    """
+    type_hints = get_type_hints(section_cls)
+    return {
+        field_info.name: type_hints.get(field_info.name, field_info.type)
+        for field_info in fields(section_cls)
+    }
+
+
+@lru_cache(maxsize=1)
+def _posture_landmark_enums() -> List[mp.solutions.pose.PoseLandmark]:
+    import mediapipe as mp
+
+    pose_landmark = mp.solutions.pose.PoseLandmark
+    return [pose_landmark(index) for index in POSTURE_LANDMARKS]
+
+
 def _serialize_value(value: Any) -> Any:
     if isinstance(value, (dict, list, tuple)):
         return json.dumps(value)
@@ -302,9 +331,7 @@ class SettingsStore:
             section_name, field_name = KEY_TO_SECTION_FIELD[key]
             self._set_field(section_name, field_name, value, persist=False)
 
-        self.save_runtime()
-        self.save_ml()
-        self.save_profile()
+        self.save_all()
         try:
             os.replace(legacy_file, legacy_file + ".legacy")
         except OSError:
@@ -317,19 +344,15 @@ class SettingsStore:
             "profile": self.profile,
         }
         for section_name, section_obj in overrides.items():
-            type_hints = get_type_hints(type(section_obj))
-            for field_info in fields(section_obj):
-                env_key = (
-                    f"{ENV_PREFIX}_{section_name.upper()}_{field_info.name.upper()}"
-                )
+            for name, expected_type in _field_types(type(section_obj)).items():
+                env_key = f"{ENV_PREFIX}_{section_name.upper()}_{name.upper()}"
                 if env_key not in os.environ:
                     continue
                 raw_value = os.environ[env_key]
-                expected_type = type_hints.get(field_info.name, field_info.type)
                 coerced = _deserialize_value(
-                    expected_type, raw_value, getattr(section_obj, field_info.name)
+                    expected_type, raw_value, getattr(section_obj, name)
                 )
-                setattr(section_obj, field_info.name, coerced)
+                setattr(section_obj, name, coerced)
 
     def _normalize_loaded_settings(self) -> None:
         runtime_changed = False
@@ -496,24 +519,44 @@ class SettingsStore:
     def _load_group(self, group_name: str, section_obj: Any) -> None:
         self._settings.beginGroup(group_name)
         try:
-            type_hints = get_type_hints(type(section_obj))
-            for field_info in fields(section_obj):
-                default = getattr(section_obj, field_info.name)
-                raw_value = self._settings.value(field_info.name, None)
-                expected_type = type_hints.get(field_info.name, field_info.type)
+            # Fresh installs store few keys; skipping absent ones avoids a backend
+            # lookup and a no-op deserialise per field
+            stored = set(self._settings.childKeys())
+            for name, expected_type in _field_types(type(section_obj)).items():
+                if name not in stored:
+                    continue
+                default = getattr(section_obj, name)
+                raw_value = self._settings.value(name, None)
+                # Containers are stored as JSON; when the stored text is exactly
+                # what the current value serialises to, keep the object instead
+                # of decoding and re-coercing every element.
+                if (
+                    isinstance(raw_value, str)
+                    and isinstance(default, (dict, list, tuple))
+                    and raw_value == _serialize_value(default)
+                ):
+                    continue
                 value = _deserialize_value(expected_type, raw_value, default)
-                setattr(section_obj, field_info.name, value)
+                setattr(section_obj, name, value)
         finally:
             self._settings.endGroup()
 
-    def _save_group(self, group_name: str, section_obj: Any) -> None:
+    def _save_group(self, group_name: str, section_obj: Any, sync: bool = True) -> None:
         self._settings.beginGroup(group_name)
         try:
-            for field_info in fields(section_obj):
-                value = getattr(section_obj, field_info.name)
-                self._settings.setValue(field_info.name, _serialize_value(value))
+            for name in _field_types(type(section_obj)):
+                value = getattr(section_obj, name)
+                self._settings.setValue(name, _serialize_value(value))
         finally:
             self._settings.endGroup()
+        if sync:
+            self._settings.sync()
+
+    def save_all(self) -> None:
+        """Write every section and flush the backing store once, not per section."""
+        self._save_group("runtime", self.runtime, sync=False)
+        self._save_group("ml", self.ml, sync=False)
+        self._save_group("profile", self.profile, sync=False)
         self._settings.sync()
 
     def save_runtime(self) -> None:
@@ -532,25 +575,18 @@ class SettingsStore:
         if section is None:
             raise KeyError(f"Unknown settings section: {section_name}")
 
-        for field_info in fields(section):
-            if field_info.name != field_name:
-                continue
-            type_hints = get_type_hints(type(section))
-            expected_type = type_hints.get(field_info.name, field_info.type)
-            coerced = _deserialize_value(
-                expected_type, value, getattr(section, field_name)
-            )
-            setattr(section, field_name, coerced)
-            if persist:
-                if section_name == "runtime":
-                    self.save_runtime()
-                elif section_name == "ml":
-                    self.save_ml()
-                elif section_name == "profile":
-                    self.save_profile()
-            return
-
-        raise KeyError(f"Unknown field {field_name} in section {section_name}")
+        expected_type = _field_types(type(section)).get(field_name)
+        if expected_type is None:
+            raise KeyError(f"Unknown field {field_name} in section {section_name}")
+        coerced = _deserialize_value(expected_type, value, getattr(section, field_name))
+        setattr(section, field_name, coerced)
+        if persist:
+            if section_name == "runtime":
+                self.save_runtime()
+            elif section_name == "ml":
+                self.save_ml()
+            elif section_name == "profile":
+                self.save_profile()
 
     def get(self, key: str) -> Any:
         section_name, field_name = KEY_TO_SECTION_FIELD[key]
@@ -563,20 +599,28 @@ class SettingsStore:
         section_name, field_name = KEY_TO_SECTION_FIELD[key]
         self._set_field(section_name, field_name, value)
 
+    # Bulk updates stage their values in QSettings without syncing. QSettings
+    # writes pending changes from the event loop and on destruction, and callers
+    # that need them on disk at once follow up with save_all() or flush(), so a
+    # dialog applying several sections touches the file once.
     def update_runtime(self, **overrides: Any) -> None:
         for field_name, value in overrides.items():
             self._set_field("runtime", field_name, value, persist=False)
-        self.save_runtime()
+        self._save_group("runtime", self.runtime, sync=False)
 
     def update_ml(self, **overrides: Any) -> None:
         for field_name, value in overrides.items():
             self._set_field("ml", field_name, value, persist=False)
-        self.save_ml()
+        self._save_group("ml", self.ml, sync=False)
 
     def update_profile(self, **overrides: Any) -> None:
         for field_name, value in overrides.items():
             self._set_field("profile", field_name, value, persist=False)
-        self.save_profile()
+        self._save_group("profile", self.profile, sync=False)
+
+    def flush(self) -> None:
+        """Write staged settings to the backing store now."""
+        self._settings.sync()
 
 
 KEY_TO_SECTION_FIELD: Dict[str, Tuple[str, str]] = {
@@ -646,12 +690,10 @@ class SettingsService:
         self._store.update_profile(**overrides)
 
     def save_all(self) -> None:
-        self._store.save_runtime()
-        self._store.save_ml()
-        self._store.save_profile()
+        self._store.save_all()
 
     def get_posture_landmarks(self) -> List[mp.solutions.pose.PoseLandmark]:
-        return POSTURE_LANDMARKS
+        return _posture_landmark_enums()
 
     @classmethod
     def for_testing(
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from typing import Callable, Dict
 
-from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+# Timers at least this long only need whole-second accuracy, which lets the OS
+# batch their wake-ups with other work
+_VERY_COARSE_THRESHOLD_MS = 60_000
 
 
 class TaskScheduler(QObject):
@@ -15,16 +19,46 @@ class TaskScheduler(QObject):
     def schedule(
         self, name: str, interval_ms: int, callback: Callable[[], None]
     ) -> None:
-        if name in self._timers:
-            self.cancel(name)
-        timer = QTimer(self)
-        timer.timeout.connect(callback)
-        timer.start(interval_ms)
-        self._timers[name] = timer
+        self._start_timer(name, interval_ms, callback, single_shot=False)
+
+    def schedule_once(
+        self, name: str, delay_ms: int, callback: Callable[[], None]
+    ) -> None:
+        """Run *callback* once after *delay_ms*; re-scheduling *name* replaces it."""
+        self._start_timer(name, delay_ms, callback, single_shot=True)
 
     def single_shot(self, delay_ms: int, callback: Callable[[], None]) -> None:
         QTimer.singleShot(delay_ms, callback)
 
+    def _start_timer(
+        self,
+        name: str,
+        interval_ms: int,
+        callback: Callable[[], None],
+        single_shot: bool,
+    ) -> None:
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = QTimer(self)
+            self._timers[name] = timer
+        else:
+            # Re-arming reuses the QTimer rather than allocating a new one
+            timer.stop()
+            timer.timeout.disconnect()
+        timer.setSingleShot(single_shot)
+        timer.setTimerType(
+            Qt.TimerType.VeryCoarseTimer
+            if interval_ms >= _VERY_COARSE_THRESHOLD_MS
+            else Qt.TimerType.CoarseTimer
+        )
+        timer.timeout.connect(callback)
+        timer.start(interval_ms)
+
+    def is_pending(self, name: str) -> bool:
+        """Return True while timer *name* is armed and has not fired yet."""
+        timer = self._timers.get(name)
+        return timer is not None and timer.isActive()
+
     def cancel(self, name: str) -> None:
         timer = self._timers.pop(name, None)
         if timer:
@@ -50,3 +50,62 @@ def test_save_pose_data(mock_datetime, db_manager):
     assert first_landmark[3] == 2.0  # y
     assert first_landmark[4] == 3.0  # z
     assert first_landmark[5] == 0.9  # visibility
+
+
+def test_queue_pose_data_is_written_on_close(tmp_path):
+    settings = SettingsService.for_testing(tmp_path / "queue_settings.ini")
+    manager = Database(str(tmp_path / "queue.db"), settings.get_posture_landmarks())
+
+    for score in (10.0, 20.0, 30.0):
+        mock_landmarks = MagicMock()
+        mock_landmark = MagicMock(x=score / 100, y=2.0, z=3.0, visibility=0.9)
+        mock_landmarks.landmark = {
+            enum: mock_landmark for enum in manager.landmark_enums
+        }
+        manager.queue_pose_data(mock_landmarks, score)
+    # close() drains the writer queue before closing the connection
+    manager.close()
+
+    reopened = Database(str(tmp_path / "queue.db"), settings.get_posture_landmarks())
+    try:
+        scores = reopened.cursor.execute(
+            "SELECT score FROM posture_scores ORDER BY rowid"
+        ).fetchall()
+        assert [row[0] for row in scores] == [10.0, 20.0, 30.0]
+        landmark_count = reopened.cursor.execute(
+            "SELECT COUNT(*) FROM pose_landmarks"
+        ).fetchone()[0]
+        assert landmark_count == 3 * len(reopened.landmark_enums)
+    finally:
+        reopened.close()
+
+
+def test_queue_pose_data_skips_unchanged_landmarks(tmp_path):
+    settings = SettingsService.for_testing(tmp_path / "dedupe_settings.ini")
+    manager = Database(str(tmp_path / "dedupe.db"), settings.get_posture_landmarks())
+
+    mock_landmarks = MagicMock()
+    mock_landmark = MagicMock(x=0.5, y=0.5, z=0.1, visibility=0.9)
+    mock_landmarks.landmark = {enum: mock_landmark for enum in manager.landmark_enums}
+
+    for score in (10.0, 20.0):
+        manager.queue_pose_data(mock_landmarks, score)
+    manager.close()
+
+    reopened = Database(str(tmp_path / "dedupe.db"), settings.get_posture_landmarks())
+    try:
+        score_count = reopened.cursor.execute(
+            "SELECT COUNT(*) FROM posture_scores"
+        ).fetchone()[0]
+        assert score_count == 2
+        landmark_count = reopened.cursor.execute(
+            "SELECT COUNT(*) FROM pose_landmarks"
+        ).fetchone()[0]
+        assert landmark_count == len(reopened.landmark_enums)
+    finally:
+        reopened.close()
+
+
+def test_load_dashboard_scores_returns_newest_window_oldest_first(db_manager):
+    db_manager.save_dashboard_history([(float(ts), ts * 10.0) for ts in range(5)])
+    assert db_manager.load_dashboard_scores(limit=3) == [20.0, 30.0, 40.0]
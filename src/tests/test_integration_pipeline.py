@@ -64,6 +64,23 @@ def test_score_service_returns_zero_when_empty(score_service):
     assert score_service.average() == 0.0
 
 
+def test_add_score_returns_rolling_average(score_service):
+    """add_score() should hand back the same value average() reports."""
+    score_service.add_score(60.0)
+    returned = score_service.add_score(80.0)
+    assert returned == pytest.approx(score_service.average())
+
+
+def test_rolling_average_tracks_buffer_wraparound(settings):
+    settings.update_ml(score_buffer_size=3)
+    svc = ScoreService(settings)
+    for score in (10.0, 20.0, 30.0, 40.0, 50.0):
+        average = svc.add_score(score)
+    # Only the newest three fit in the buffer
+    assert average == pytest.approx(40.0)
+    assert svc.average(window_seconds=3600) == pytest.approx(40.0)
+
+
 # ---------------------------------------------------------------------------
 # 2. Notification fires when score is below threshold
 # ---------------------------------------------------------------------------
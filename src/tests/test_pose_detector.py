@@ -61,6 +61,11 @@ class TestPoseDetector:
         assert score == 0.0
         assert landmarks is None  # or whatever the expected value should be
 
+    def test_measure_empty_frame(self, pd, mock_frame):
+        assert pd.measure_frame(mock_frame) is None
+        # The input frame is never annotated
+        assert not mock_frame.any()
+
     @pytest.mark.parametrize(
         "landmark_dict,expected_range",
         [
@@ -108,6 +113,13 @@ class TestPoseDetector:
         angle = pd.angle_between(vector1, vector2)
         assert abs(angle - expected_angle) < 0.01
 
+    def test_angles_between_matches_scalar(self, pd):
+        v1 = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        v2 = np.array([[0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.0, -1.0, 0.0]])
+        angles = pd._angles_between(v1, v2)
+        expected = [pd.angle_between(a, b) for a, b in zip(v1, v2)]
+        assert np.allclose(angles, expected)
+
     def test_draw_posture_feedback(self, pd, mock_frame):
         # Test representative values only
         for score in [0, 100]:
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import itertools
 from collections import deque
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
-import cv2
-from PyQt6.QtCore import Qt
+import numpy as np
+from PyQt6.QtCore import QPointF, QRect, QSize, Qt, QTimer
 from PyQt6.QtGui import (
+    QBrush,
     QColor,
     QImage,
     QPainter,
-    QPainterPath,
     QPen,
-    QPixmap,
     QPalette,
+    QPixmap,
+    QPolygonF,
 )
 from PyQt6.QtWidgets import (
     QLabel,
@@ -25,6 +28,104 @@ from PyQt6.QtWidgets import (
 )
 
 
+def _build_theme(
+    background: str,
+    foreground: str,
+    accent: QColor,
+    fill: QColor,
+    stat_bg: str,
+    stat_border: str,
+) -> Dict[str, object]:
+    """Precompute a theme's colours and stylesheets once at import time."""
+    return {
+        "background": QColor(background),
+        "foreground": QColor(foreground),
+        "accent": accent,
+        "fill": fill,
+        "dialog_style": f"QDialog {{ background-color: {background}; }}",
+        "card_style": (
+            f"QFrame#dashboardCard {{"
+            f"  background-color: {background};"
+            f"  border-radius: 12px;"
+            f"  border: 1px solid rgba(0,0,0,25);"
+            f"}}"
+            f"QLabel {{ color: {foreground}; }}"
+        ),
+        "feedback_style": f"color: {foreground}; font-weight: 600; font-size: 13px;",
+        "stat_style": (
+            f"background: {stat_bg}; color: {foreground}; font-size: 11px;"
+            f"border: 1px solid {stat_border}; border-radius: 8px; padding: 6px 8px;"
+        ),
+    }
+
+
+# Applying a theme is a dict lookup plus setStyleSheet with ready-made strings
+_THEMES = {
+    "dark": _build_theme(
+        "#202124",
+        "#f1f3f4",
+        QColor("#8ab4f8"),
+        QColor(138, 180, 248, 60),
+        "#2d2f33",
+        "rgba(255,255,255,12)",
+    ),
+    "light": _build_theme(
+        "#ffffff",
+        "#1a1c23",
+        QColor("#2e7dff"),
+        QColor(46, 125, 255, 60),
+        "#f8f9fa",
+        "rgba(0,0,0,10)",
+    ),
+}
+
+
+def _polygon_from_xy(xs: np.ndarray, ys: np.ndarray) -> QPolygonF:
+    """Build a QPolygonF by writing coordinates straight into its point buffer."""
+    polygon = QPolygonF()
+    polygon.fill(QPointF(), len(xs))
+    # QPointF is two packed doubles, so the buffer is viewable as an (n, 2) array
+    buffer = polygon.data()
+    buffer.setsize(len(xs) * 2 * 8)
+    points = np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)
+    points[:, 0] = xs
+    points[:, 1] = ys
+    return polygon
+
+
+def _lttb_indices(values: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of at most *n_out* samples chosen by Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last samples and, from each bucket in between, the one
+    spanning the largest triangle with the previous pick and the next bucket's
+    mean, so the decimated line keeps the visual shape of the full series.
+    """
+    n = values.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64).tolist()
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_end = edges[bucket + 2]
+            next_x = (end + next_end - 1) * 0.5
+            next_y = float(values[end:next_end].mean())
+        else:
+            next_x, next_y = n - 1, float(values[-1])
+        anchor_y = float(values[anchor])
+        xs = np.arange(start, end)
+        areas = np.abs(
+            (anchor - next_x) * (values[start:end] - anchor_y)
+            - (anchor - xs) * (next_y - anchor_y)
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+    return selected
+
+
 def _score_color(score: float) -> QColor:
     """Interpolate red→amber→green for a score 0–100."""
     s = max(0.0, min(100.0, score)) / 100.0
@@ -38,6 +139,24 @@ def _score_color(score: float) -> QColor:
             int(160 * (1 - t) + 199 * t),
             int(40 * (1 - t) + 89 * t),
         )
+    return _rgb_color(r, g, b)
+
+
+def _score_rgb(scores: np.ndarray) -> np.ndarray:
+    """Vectorised _score_color(): an (n, 3) int array of RGB rows for *scores*."""
+    s = np.clip(scores, 0.0, 100.0) / 100.0
+    low = s < 0.5
+    t = np.where(low, s / 0.5, (s - 0.5) / 0.5)
+    rgb = np.empty((s.size, 3), dtype=np.float64)
+    rgb[:, 0] = np.where(low, 220 * (1 - t) + 240 * t, 240 * (1 - t) + 52 * t)
+    rgb[:, 1] = np.where(low, 50 * (1 - t) + 160 * t, 160 * (1 - t) + 199 * t)
+    rgb[:, 2] = np.where(low, 40.0, 40 * (1 - t) + 89 * t)
+    return rgb.astype(np.int32)
+
+
+@lru_cache(maxsize=None)
+def _rgb_color(r: int, g: int, b: int) -> QColor:
+    """Shared QColor per RGB triple, so equal segment colours are the same object."""
     return QColor(r, g, b)
 
 
@@ -59,81 +178,254 @@ def _format_duration(seconds: float) -> str:
     return f"{secs}s"
 
 
+_SPARKLINE_CAPACITY = 120
+
+
 class SparklineWidget(QWidget):
     """Score history area chart with per-segment colour coding.
 
-    Displays up to 120 recent posture scores as a filled area chart. Each line
+    Displays up to 120 recent posture scores as a filled area chart, stored in a
+    NumPy ring buffer fed one score at a time via append_value(). Each line
     segment is coloured by interpolating red (0) → amber (50) → green (100) based
     on the average of its two endpoints. Pre-populated from persisted database
     history when the dashboard reopens, so the chart isn't blank after a restart.
     """
 
-    def __init__(self, parent: Optional[QWidget] = None) -> None:
+    def __init__(
+        self, parent: Optional[QWidget] = None, capacity: int = _SPARKLINE_CAPACITY
+    ) -> None:
         super().__init__(parent)
-        self.values: List[float] = []
-        self.fill_color = QColor(46, 125, 255, 60)
-        self.background_color = QColor("#ffffff")
+        # Fixed-size ring of the most recent scores; _count is the total appended
+        self._ring = np.zeros(capacity, dtype=np.float64)
+        self._count = 0
+        # Range of the held values, maintained by the mutators for paintEvent.
+        # Monotonic (index, value) windows give the extremes in amortised O(1)
+        # as samples enter and leave the ring.
+        self._min = 0.0
+        self._max = 0.0
+        self._min_window: Deque[Tuple[int, float]] = deque()
+        self._max_window: Deque[Tuple[int, float]] = deque()
+        # Last rendered chart; repaints without new data just blit it
+        self._pixmap: Optional[QPixmap] = None
+        self._pixmap_key: Optional[tuple] = None
+        # Painting objects are built once and reused by every paintEvent
+        self._segment_pen = QPen(QColor(), 2.0)
+        self._segment_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._segment_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        self._placeholder_pen = QPen(QColor("#aaaaaa"), 1.5)
+        self.set_colors(QColor(), QColor(46, 125, 255, 60), QColor("#ffffff"))
         self.setMinimumHeight(70)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
+    @property
+    def sample_count(self) -> int:
+        """Number of scores currently held (at most the ring capacity)."""
+        return min(self._count, self._ring.size)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Scores currently shown, oldest first."""
+        capacity = self._ring.size
+        if self._count <= capacity:
+            return self._ring[: self._count]
+        start = self._count % capacity
+        return np.concatenate((self._ring[start:], self._ring[:start]))
+
     def set_colors(self, _line: QColor, fill: QColor, background: QColor) -> None:
         self.fill_color = fill
         self.background_color = background
+        self._fill_brush = QBrush(fill)
+        self._background_brush = QBrush(background)
+        self._pixmap = None
         self.update()
 
-    def update_values(self, values: List[float]) -> None:
-        self.values = values
+    def update_values(self, values: Iterable[float]) -> None:
+        """Replace the whole series, keeping only the newest *capacity* values."""
+        array = np.fromiter(values, dtype=np.float64)[-self._ring.size :]
+        self._ring[: array.size] = array
+        self._count = int(array.size)
+        self._min_window.clear()
+        self._max_window.clear()
+        for index, value in enumerate(array.tolist()):
+            self._push_extremes(index, value)
+        self._pixmap = None
         self.update()
 
+    def _push_extremes(self, index: int, value: float) -> None:
+        """Add sample *index* to the min/max windows and drop evicted samples."""
+        oldest = index - self._ring.size + 1
+        min_window = self._min_window
+        while min_window and min_window[-1][1] >= value:
+            min_window.pop()
+        min_window.append((index, value))
+        if min_window[0][0] < oldest:
+            min_window.popleft()
+        max_window = self._max_window
+        while max_window and max_window[-1][1] <= value:
+            max_window.pop()
+        max_window.append((index, value))
+        if max_window[0][0] < oldest:
+            max_window.popleft()
+        self._min = min_window[0][1]
+        self._max = max_window[0][1]
+
+    def append_value(self, value: float) -> None:
+        """Append one score, evicting the oldest once the ring is full."""
+        value = float(value)
+        self._ring[self._count % self._ring.size] = value
+        self._push_extremes(self._count, value)
+        self._count += 1
+        self._pixmap = None
+        self.update()
+
+    def _build_geometry(self, rect) -> Tuple[QPolygonF, List[Tuple[QColor, QPolygonF]]]:
+        """Return the fill polygon and the coloured polylines of the line for *rect*."""
+        values = self.values
+        total = values.size
+        # More samples than pixel columns would only draw sub-pixel segments, so
+        # a narrow widget draws an LTTB selection that keeps peaks and dips
+        positions = _lttb_indices(values, max(rect.width(), 2))
+        if positions.size < total:
+            values = values[positions]
+        n = values.size
+        min_val = self._min
+        max_val = self._max
+        if abs(max_val - min_val) < 1e-5:
+            min_val = max(0.0, min_val - 5)
+            max_val = min(100.0, max_val + 5)
+
+        # All point coordinates in one vectorised pass instead of per-sample maths
+        xs = rect.left() + positions * (rect.width() / (total - 1))
+        ys = rect.bottom() - (values - min_val) / (max_val - min_val) * rect.height()
+        # Fill outline: bottom-left corner, every sample, bottom-right corner —
+        # written straight into a QPolygonF that Qt fills in one call
+        bottom = float(rect.bottom())
+        fill_polygon = _polygon_from_xy(
+            np.concatenate(([xs[0]], xs, [xs[-1]])),
+            np.concatenate(([bottom], ys, [bottom])),
+        )
+
+        # Segment colours and the runs of equal colour are found in one NumPy
+        # pass; each run becomes a single polyline, so a steady score is drawn
+        # with a handful of calls instead of one per segment.
+        rgb = _score_rgb((values[:-1] + values[1:]) * 0.5)
+        changes = np.flatnonzero((rgb[1:] != rgb[:-1]).any(axis=1)) + 1
+        starts = np.concatenate(([0], changes))
+        ends = np.concatenate((changes, [n - 1]))
+        # Sample i sits at index i + 1 of the fill outline
+        runs = [
+            (_rgb_color(*color), fill_polygon.mid(start + 1, end - start + 1))
+            for color, start, end in zip(
+                rgb[starts].tolist(), starts.tolist(), ends.tolist()
+            )
+        ]
+        return fill_polygon, runs
+
     def paintEvent(self, event):  # noqa: N802
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # The chart only changes with new values, colours or size; other repaints
+        # (expose, overlapping windows) reuse the cached rendering.
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio)
+        if self._pixmap is None or key != self._pixmap_key:
+            self._pixmap_key = key
+            pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap_painter = QPainter(pixmap)
+            self._render(pixmap_painter)
+            pixmap_painter.end()
+            self._pixmap = pixmap
+        QPainter(self).drawPixmap(0, 0, self._pixmap)
+
+    def _render(self, painter: QPainter) -> None:
         rect = self.rect().adjusted(4, 4, -4, -4)
-        painter.fillRect(rect, self.background_color)
+        painter.fillRect(rect, self._background_brush)
 
-        if len(self.values) < 2:
-            painter.setPen(QPen(QColor("#aaaaaa"), 1.5))
+        if self.sample_count < 2:
+            painter.setPen(self._placeholder_pen)
             painter.drawLine(
                 rect.left(), rect.center().y(), rect.right(), rect.center().y()
             )
             return
 
-        min_val = min(self.values)
-        max_val = max(self.values)
-        if abs(max_val - min_val) < 1e-5:
-            min_val = max(0.0, min_val - 5)
-            max_val = min(100.0, max_val + 5)
+        fill_polygon, runs = self._build_geometry(rect)
+
+        # Filled area — drawn without antialiasing; the soft fill hides jagged edges.
+        # drawPolygon closes the outline itself, so no QPainterPath is needed.
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._fill_brush)
+        painter.drawPolygon(fill_polygon)
 
-        n = len(self.values)
-
-        def _xy(index: int, value: float):
-            x = rect.left() + (index / (n - 1)) * rect.width()
-            norm = (value - min_val) / (max_val - min_val)
-            y = rect.bottom() - norm * rect.height()
-            return x, y
-
-        # Filled area
-        fill_path = QPainterPath()
-        x0, y0 = _xy(0, self.values[0])
-        fill_path.moveTo(x0, rect.bottom())
-        fill_path.lineTo(x0, y0)
-        for i in range(1, n):
-            xi, yi = _xy(i, self.values[i])
-            fill_path.lineTo(xi, yi)
-        fill_path.lineTo(_xy(n - 1, self.values[-1])[0], rect.bottom())
-        fill_path.closeSubpath()
-        painter.fillPath(fill_path, self.fill_color)
-
-        # Colour-coded line segments — reuse one QPen, only swap the colour
-        pen = QPen(QColor(), 2.0)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        for i in range(1, n):
-            x1, y1 = _xy(i - 1, self.values[i - 1])
-            x2, y2 = _xy(i, self.values[i])
-            avg = (self.values[i - 1] + self.values[i]) / 2
-            pen.setColor(_score_color(avg))
+        # Colour-coded polylines — reuse one QPen, only swap the colour.
+        # Antialiasing is only enabled for the thin lines, where it is visible.
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = self._segment_pen
+        for color, polyline in runs:
+            pen.setColor(color)
             painter.setPen(pen)
-            painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+            painter.drawPolyline(polyline)
+
+
+class _FrameView(QWidget):
+    """Camera preview that paints the latest frame's QImage directly.
+
+    Skips the QImage → QPixmap conversion and the separate scaling pass a QLabel
+    would need; drawImage() blits the frame into an aspect-fitted rectangle.
+    """
+
+    def __init__(self, placeholder: str, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._placeholder = placeholder
+        self._placeholder_color = QColor("#888888")
+        # The frame is kept alongside the QImage that wraps its buffer
+        self._frame = None
+        self._image: Optional[QImage] = None
+        self._target_key: Optional[tuple] = None
+        self._target_rect = QRect()
+        self.setMinimumSize(560, 320)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def set_placeholder_color(self, color: QColor) -> None:
+        self._placeholder_color = color
+        self.update()
+
+    def preview_size(self) -> Tuple[int, int]:
+        """Widget size in device pixels, for producers that pre-scale frames."""
+        ratio = self.devicePixelRatioF()
+        return int(self.width() * ratio), int(self.height() * ratio)
+
+    def set_frame(self, frame) -> None:
+        # Qt reads the camera's BGR layout directly, so no colour-conversion copy is
+        # made; QImage needs packed rows, which is a no-op for OpenCV's own buffers.
+        if not frame.flags["C_CONTIGUOUS"]:
+            frame = np.ascontiguousarray(frame)
+        h, w, ch = frame.shape
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, ch * w, QImage.Format.Format_BGR888)
+        self.update()
+
+    def _fitted_rect(self, image: QImage) -> QRect:
+        # Only recompute the aspect fit when the widget or camera size changes
+        key = (self.width(), self.height(), image.width(), image.height())
+        if key != self._target_key:
+            self._target_key = key
+            size = QSize(image.width(), image.height()).scaled(
+                self.size(), Qt.AspectRatioMode.KeepAspectRatio
+            )
+            rect = QRect(0, 0, size.width(), size.height())
+            rect.moveCenter(self.rect().center())
+            self._target_rect = rect
+        return self._target_rect
+
+    def paintEvent(self, event):  # noqa: N802
+        painter = QPainter(self)
+        if self._image is None:
+            painter.setPen(self._placeholder_color)
+            painter.drawText(
+                self.rect(), Qt.AlignmentFlag.AlignCenter, self._placeholder
+            )
+            return
+        painter.drawImage(self._fitted_rect(self._image), self._image)
 
 
 class _StatLabel(QLabel):
@@ -142,36 +434,56 @@ class _StatLabel(QLabel):
     def __init__(self, title: str, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._title = title
+        self._value: Optional[str] = None
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._update_text("—")
 
     def set_value(self, value: str) -> None:
-        self._update_text(value)
+        # setText relayouts and repaints even for identical text, so skip no-ops
+        if value != self._value:
+            self._update_text(value)
 
     def _update_text(self, value: str) -> None:
+        self._value = value
         self.setText(
             f"<small style='opacity:0.6'>{self._title}</small><br><b>{value}</b>"
         )
 
 
 class PostureDashboard(QDialog):
+    # Spine angle (degrees) above which the "sit tall" cue is offered
+    _SPINE_CUE_THRESHOLD = 10.0
+
     def __init__(
         self,
         baseline_score: float,
         preferred_theme: str,
         baseline_neck_angle: float = 10.0,
         baseline_shoulder_level: float = 0.05,
-        history: Optional[List[float]] = None,
+        history: Optional[Iterable[float]] = None,
         parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
         self.setWindowTitle("Posture Dashboard")
-        self.recent_scores: deque[float] = deque(maxlen=120)
-        if history:
-            self.recent_scores.extend(history)
         self.baseline_score = baseline_score
         self.baseline_neck_angle = baseline_neck_angle
         self.baseline_shoulder_level = baseline_shoulder_level
+        # Coaching thresholds and translated cues are fixed for the window's life
+        self._good_score = max(baseline_score - 5, 70)
+        self._neck_cue_threshold = baseline_neck_angle + 5.0
+        self._shoulder_cue_threshold = baseline_shoulder_level + 0.02
+        self._cue_good = self.tr(
+            "Nice alignment! Keep a relaxed breath and soft shoulders."
+        )
+        self._cue_neck = self.tr("Gently draw your head back over your shoulders.")
+        self._cue_shoulders = self.tr("Level your shoulders to center your posture.")
+        self._cue_spine = self.tr("Lengthen through your spine and sit tall.")
+        self._cue_reset = self.tr(
+            "Reset by rolling your shoulders back and opening your chest."
+        )
+        # Latest frame waiting to be shown; converted at most once per event-loop pass
+        self._pending_frame = None
+        self._frame_flush_scheduled = False
 
         outer_layout = QVBoxLayout(self)
         outer_layout.setContentsMargins(12, 12, 12, 12)
@@ -182,15 +494,12 @@ class PostureDashboard(QDialog):
         card_layout.setSpacing(12)
 
         # Video feed
-        self.video_label = QLabel(self.tr("Waiting for frames…"))
-        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_label.setMinimumSize(560, 320)
-        self.video_label.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
+        self.video_view = _FrameView(self.tr("Waiting for frames…"))
 
         # Sparkline
         self.sparkline = SparklineWidget()
+        if history is not None:
+            self.sparkline.update_values(history)
 
         # Stats row
         stats_row = QWidget()
@@ -212,14 +521,17 @@ class PostureDashboard(QDialog):
             self._stat_duration,
         ):
             stats_layout.addWidget(stat)
+        # Rounded score and grade currently shown in the "Current" stat
+        self._current_key: Optional[Tuple[int, str]] = None
 
         # Coaching / alert text
-        self.feedback_label = QLabel(
-            self.tr("Settle into a neutral posture while we gather readings.")
+        self._feedback_message = self.tr(
+            "Settle into a neutral posture while we gather readings."
         )
+        self.feedback_label = QLabel(self._feedback_message)
         self.feedback_label.setWordWrap(True)
 
-        card_layout.addWidget(self.video_label)
+        card_layout.addWidget(self.video_view)
         card_layout.addWidget(self.sparkline)
         card_layout.addWidget(stats_row)
         card_layout.addWidget(self.feedback_label)
@@ -242,37 +554,10 @@ class PostureDashboard(QDialog):
             )
             is_dark = luminance < 128
 
-        if is_dark:
-            background = QColor("#202124")
-            foreground = QColor("#f1f3f4")
-            accent = QColor("#8ab4f8")
-            fill = QColor(138, 180, 248, 60)
-            stat_bg = "#2d2f33"
-            stat_border = "rgba(255,255,255,12)"
-        else:
-            background = QColor("#ffffff")
-            foreground = QColor("#1a1c23")
-            accent = QColor("#2e7dff")
-            fill = QColor(46, 125, 255, 60)
-            stat_bg = "#f8f9fa"
-            stat_border = "rgba(0,0,0,10)"
-
-        self.setStyleSheet(f"QDialog {{ background-color: {background.name()}; }}")
-        self.card.setStyleSheet(
-            f"QFrame#dashboardCard {{"
-            f"  background-color: {background.name()};"
-            f"  border-radius: 12px;"
-            f"  border: 1px solid rgba(0,0,0,25);"
-            f"}}"
-            f"QLabel {{ color: {foreground.name()}; }}"
-        )
-        self.feedback_label.setStyleSheet(
-            f"color: {foreground.name()}; font-weight: 600; font-size: 13px;"
-        )
-        stat_style = (
-            f"background: {stat_bg}; color: {foreground.name()}; font-size: 11px;"
-            f"border: 1px solid {stat_border}; border-radius: 8px; padding: 6px 8px;"
-        )
+        theme = _THEMES["dark" if is_dark else "light"]
+        self.setStyleSheet(theme["dialog_style"])
+        self.card.setStyleSheet(theme["card_style"])
+        self.feedback_label.setStyleSheet(theme["feedback_style"])
         for stat in (
             self._stat_current,
             self._stat_avg,
@@ -281,27 +566,35 @@ class PostureDashboard(QDialog):
             self._stat_streak,
             self._stat_duration,
         ):
-            stat.setStyleSheet(stat_style)
-        self.sparkline.set_colors(accent, fill, background)
+            stat.setStyleSheet(theme["stat_style"])
+        self.sparkline.set_colors(theme["accent"], theme["fill"], theme["background"])
+        self.video_view.set_placeholder_color(theme["foreground"])
+
+    def prepend_history(self, scores: Iterable[float]) -> None:
+        """Put previously saved *scores* in front of the values shown so far."""
+        current = self.sparkline.values
+        self.sparkline.update_values(itertools.chain(scores, current.tolist()))
 
     def get_history(self) -> List[float]:
         """Return current sparkline scores for persistence."""
-        return list(self.recent_scores)
+        return self.sparkline.values.tolist()
+
+    def preview_size(self) -> Tuple[int, int]:
+        """Video area size in device pixels, for producers that pre-scale frames."""
+        return self.video_view.preview_size()
 
     def update_frame(self, frame) -> None:
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_frame.shape
-        image = QImage(rgb_frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(image)
-        ratio = self.devicePixelRatioF()
-        pixmap.setDevicePixelRatio(ratio)
-        scaled = pixmap.scaled(
-            int(self.video_label.width() * ratio),
-            int(self.video_label.height() * ratio),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.video_label.setPixmap(scaled)
+        """Queue *frame* for display, coalescing frames that arrive faster than paints."""
+        self._pending_frame = frame
+        if not self._frame_flush_scheduled:
+            self._frame_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_frame)
+
+    def _flush_frame(self) -> None:
+        self._frame_flush_scheduled = False
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is not None:
+            self.video_view.set_frame(frame)
 
     def update_score(
         self,
@@ -309,17 +602,22 @@ class PostureDashboard(QDialog):
         metrics: Optional[Dict[str, float]] = None,
         session_stats: Optional[dict] = None,
     ) -> None:
-        self.recent_scores.append(score)
-        self.sparkline.update_values(list(self.recent_scores))
+        self.sparkline.append_value(score)
         self._update_feedback_text(score, metrics)
         self._update_stats(score, session_stats)
 
     def _update_stats(self, current: float, stats: Optional[dict]) -> None:
+        # The stat shows a whole number; between integer steps the colour
+        # lookup and HTML formatting would only rebuild the same text
         grade = score_grade(current)
-        color = _score_color(current).name()
-        self._stat_current.set_value(
-            f"<span style='color:{color}'>{current:.0f}</span> <small>({grade})</small>"
-        )
+        current_key = (round(current), grade)
+        if current_key != self._current_key:
+            self._current_key = current_key
+            color = _score_color(current).name()
+            self._stat_current.set_value(
+                f"<span style='color:{color}'>{current:.0f}</span>"
+                f" <small>({grade})</small>"
+            )
         if stats and stats.get("count", 0) > 0:
             self._stat_avg.set_value(f"{stats['avg']:.0f}")
             self._stat_min.set_value(
@@ -347,28 +645,24 @@ class PostureDashboard(QDialog):
     def _update_feedback_text(
         self, score: float, metrics: Optional[Dict[str, float]]
     ) -> None:
-        if score >= max(self.baseline_score - 5, 70):
-            message = self.tr(
-                "Nice alignment! Keep a relaxed breath and soft shoulders."
-            )
+        if score >= self._good_score:
+            message = self._cue_good
         else:
             cues: List[str] = []
             if metrics:
-                neck_threshold = self.baseline_neck_angle + 5.0
-                shoulder_threshold = self.baseline_shoulder_level + 0.02
-                if metrics.get("neck_angle", 0.0) > neck_threshold:
-                    cues.append(
-                        self.tr("Gently draw your head back over your shoulders.")
-                    )
-                if metrics.get("shoulder_vertical_delta", 0.0) > shoulder_threshold:
-                    cues.append(self.tr("Level your shoulders to center your posture."))
-                if metrics.get("spine_angle", 0.0) > 10.0:
-                    cues.append(self.tr("Lengthen through your spine and sit tall."))
-            if not cues:
-                cues.append(
-                    self.tr(
-                        "Reset by rolling your shoulders back and opening your chest."
-                    )
-                )
-            message = " ".join(cues[:2])
-        self.feedback_label.setText(message)
+                if metrics.get("neck_angle", 0.0) > self._neck_cue_threshold:
+                    cues.append(self._cue_neck)
+                if (
+                    metrics.get("shoulder_vertical_delta", 0.0)
+                    > self._shoulder_cue_threshold
+                ):
+                    cues.append(self._cue_shoulders)
+                if (
+                    len(cues) < 2
+                    and metrics.get("spine_angle", 0.0) > self._SPINE_CUE_THRESHOLD
+                ):
+                    cues.append(self._cue_spine)
+            message = " ".join(cues) if cues else self._cue_reset
+        if message != self._feedback_message:
+            self._feedback_message = message
+            self.feedback_label.setText(message)
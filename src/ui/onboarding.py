@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from operator import itemgetter
+from typing import Callable, Optional
 
 import cv2
+import numpy as np
 from PyQt6 import sip
-from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot, QObject
+from PyQt6.QtCore import (
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+    QObject,
+)
 from PyQt6.QtGui import QFont, QImage, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
@@ -28,6 +39,79 @@ from services.settings_service import (
     SettingsService,
 )
 
+# Calibration samples one frame per timer tick at this spacing; the one-frame
+# driver buffer discards the frames in between without decoding them
+_CALIBRATION_SAMPLE_INTERVAL_S = 0.1
+# Mean absolute difference (0–255, over a 1-in-8 subsample) below which a
+# calibration frame counts as unchanged and reuses the previous metrics
+_CALIBRATION_STILL_FRAME_MAD = 2.0
+# Pulls the averaged metrics out of PoseDetector's metrics dict in one call;
+# the detector always fills these keys when a pose is found
+_calibration_sample = itemgetter(
+    "posture_score", "neck_angle", "shoulder_vertical_delta"
+)
+
+
+def _open_camera(camera_id: int) -> Optional[cv2.VideoCapture]:
+    """Open *camera_id* (falling back to AVFoundation on macOS), or return None.
+
+    The driver queue is limited to one frame so previews and calibration
+    samples show the user's current posture rather than frames that have been
+    sitting in a buffer.
+    """
+    capture = cv2.VideoCapture(camera_id)
+    if not capture.isOpened() and sys.platform == "darwin":
+        capture.release()
+        capture = cv2.VideoCapture(camera_id, cv2.CAP_AVFOUNDATION)
+    if not capture.isOpened():
+        capture.release()
+        return None
+    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return capture
+
+
+class SharedCamera:
+    """One capture handle shared by the wizard's preview and calibration.
+
+    Opening a camera takes hundreds of milliseconds and blinks its LED, so the
+    device is opened on first use and kept until the wizard closes instead of
+    being reopened by every page. Only one consumer reads at a time: the
+    preview stops before calibration starts, and calibration is cancelled
+    before the preview page is shown again. Releasing a device can block for
+    a noticeable time on some backends, so it happens on the global
+    QThreadPool rather than the thread that gives the camera up.
+    """
+
+    def __init__(self, settings: SettingsService) -> None:
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._capture: Optional[cv2.VideoCapture] = None
+        self._camera_id: Optional[int] = None
+
+    def acquire(self) -> Optional[cv2.VideoCapture]:
+        """Return the open capture for the configured camera, opening it if needed."""
+        camera_id = self._settings.runtime.default_camera_id
+        with self._lock:
+            if self._capture is not None and self._camera_id == camera_id:
+                return self._capture
+            if self._capture is not None:
+                _release_later(self._capture)
+            self._capture = _open_camera(camera_id)
+            self._camera_id = camera_id if self._capture is not None else None
+            return self._capture
+
+    def release(self) -> None:
+        with self._lock:
+            capture, self._capture = self._capture, None
+            self._camera_id = None
+        if capture is not None:
+            _release_later(capture)
+
+
+def _release_later(capture: cv2.VideoCapture) -> None:
+    """Close *capture* on a pool thread so the caller never waits on the driver."""
+    QThreadPool.globalInstance().start(capture.release)
+
 
 @dataclass
 class CalibrationResult:
@@ -36,63 +120,173 @@ class CalibrationResult:
     shoulder_delta: float
 
 
+class _PreviewWorker(QObject):
+    """Reads, fits and converts preview frames on a worker QThread.
+
+    Only finished widget-sized QImages cross to the GUI thread. At most one
+    image is in flight: frames arriving while the GUI has not yet shown the
+    previous one are dropped rather than queued.
+    """
+
+    frame_ready = pyqtSignal(QImage)
+    unavailable = pyqtSignal()
+    open_failed = pyqtSignal()
+
+    def __init__(self, camera: SharedCamera, size: tuple) -> None:
+        super().__init__()
+        self._camera = camera
+        self._size = size
+        self._stop = False
+        self._in_flight = False
+        # Fingerprint of the last frame sent and the size it was scaled to
+        self._last_frame_key: Optional[tuple] = None
+        # (frame w, frame h, widget w, widget h) the cached fit was computed for
+        self._fit_key: Optional[tuple] = None
+        self._fit: tuple = ((0, 0), cv2.INTER_AREA)
+
+    def cancel(self) -> None:
+        self._stop = True
+
+    def set_size(self, size: tuple) -> None:
+        self._size = size
+
+    def frame_shown(self) -> None:
+        self._in_flight = False
+
+    @pyqtSlot()
+    def run(self) -> None:
+        # Opening the device can take hundreds of milliseconds; doing it here
+        # lets the wizard page appear straight away
+        capture = self._camera.acquire()
+        if capture is None:
+            self.open_failed.emit()
+            return
+        reported = False
+        while not self._stop:
+            # grab() blocks until the next frame, so it also paces the loop
+            if not capture.grab():
+                if not reported:
+                    reported = True
+                    self.unavailable.emit()
+                QThread.msleep(50)
+                continue
+            reported = False
+            if self._in_flight:
+                continue
+            ret, frame = capture.retrieve()
+            if not ret:
+                continue
+            image = self._convert(frame)
+            if image is not None:
+                self._in_flight = True
+                self.frame_ready.emit(image)
+
+    def _convert(self, frame: np.ndarray) -> Optional[QImage]:
+        width, height = self._size
+        if width <= 0 or height <= 0:
+            return None
+        # Drivers repeat the last buffer when the camera stalls (low light,
+        # virtual cameras); a sparse sample of the pixels is enough to spot that
+        # and skip converting and scaling an identical frame.
+        key = (hash(frame[::16, ::16].tobytes()), width, height)
+        if key == self._last_frame_key:
+            return None
+        self._last_frame_key = key
+        # Fit the frame with OpenCV's SIMD resize before anything else touches
+        # it, so the QImage copy only sees widget-sized data.
+        h, w = frame.shape[:2]
+        fit_key = (w, h, width, height)
+        if fit_key != self._fit_key:
+            # Widget and camera sizes rarely change, so the fit is derived once
+            scale = min(width / w, height / h)
+            target = (max(int(w * scale), 1), max(int(h * scale), 1))
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+            self._fit_key = fit_key
+            self._fit = (target, interpolation)
+        target, interpolation = self._fit
+        if target != (w, h):
+            frame = cv2.resize(frame, target, interpolation=interpolation)
+        frame = np.ascontiguousarray(frame)
+        h, w, ch = frame.shape
+        # Qt reads OpenCV's BGR order directly, so no colour conversion pass is
+        # needed; copy() detaches the image from the frame before it leaves the
+        # thread.
+        return QImage(frame.data, w, h, ch * w, QImage.Format.Format_BGR888).copy()
+
+
 class CameraPreviewWidget(QLabel):
+    """Live camera preview fed by a _PreviewWorker thread.
+
+    The GUI thread only turns finished images into pixmaps, so a camera that
+    blocks on a frame never stalls repainting or button handling.
+    """
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setText(self.tr("Camera preview will appear here"))
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._camera_id = 0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_frame)
-        self._capture: Optional[cv2.VideoCapture] = None
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[_PreviewWorker] = None
 
-    def start(self, camera_id: int) -> None:
+    def start(self, camera: SharedCamera) -> None:
+        """Show frames from *camera*; the wizard keeps ownership of the device."""
         self.stop()
-        self._camera_id = camera_id
-        capture = cv2.VideoCapture(self._camera_id)
-        if not capture.isOpened() and sys.platform == "darwin":
-            capture = cv2.VideoCapture(self._camera_id, cv2.CAP_AVFOUNDATION)
-        if not capture or not capture.isOpened():
-            self.setText(self.tr("Unable to open camera"))
-            return
-        self._capture = capture
-        self._timer.start(40)
+        worker = _PreviewWorker(camera, (self.width(), self.height()))
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        worker.frame_ready.connect(self._show_frame)
+        worker.unavailable.connect(self._show_unavailable)
+        worker.open_failed.connect(self._show_open_failed)
+        thread.started.connect(worker.run)
+        thread.finished.connect(worker.deleteLater)
+        self._worker = worker
+        self._thread = thread
+        thread.start()
 
     def stop(self) -> None:
-        if self._timer.isActive():
-            self._timer.stop()
-        if self._capture:
-            self._capture.release()
-            self._capture = None
+        """Stop the worker and wait for it, so the capture is free for others."""
+        worker, thread = self._worker, self._thread
+        self._worker = None
+        self._thread = None
+        if worker is not None:
+            worker.frame_ready.disconnect(self._show_frame)
+            worker.cancel()
+        if thread is not None:
+            thread.quit()
+            if thread.wait(2000):
+                thread.deleteLater()
+            else:
+                # Still blocked in a grab; deleting a running QThread aborts Qt
+                thread.finished.connect(thread.deleteLater)
         self.clear()
 
-    def _update_frame(self) -> None:
-        if not self._capture:
+    def _show_frame(self, image: QImage) -> None:
+        if self._worker is None:
             return
-        ret, frame = self._capture.read()
-        if not ret:
-            self.setText(self.tr("Camera feed unavailable"))
-            return
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame.shape
-        image = QImage(frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(image).scaled(
-            self.width(),
-            self.height(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.setPixmap(pixmap)
+        self.setPixmap(QPixmap.fromImage(image))
+        self._worker.frame_shown()
+
+    def _show_unavailable(self) -> None:
+        self.setText(self.tr("Camera feed unavailable"))
+
+    def _show_open_failed(self) -> None:
+        self.setText(self.tr("Unable to open camera"))
 
     def resizeEvent(self, event):  # noqa: N802 - Qt override
         super().resizeEvent(event)
-        if self.pixmap():
+        if self._worker is None:
+            return
+        self._worker.set_size((self.width(), self.height()))
+        if not self.pixmap().isNull():
+            # Stand-in until the worker's next frame, already smooth-scaled to
+            # the new size, arrives; a fast scale keeps interactive resizing
+            # cheap and the placeholder is only on screen for one frame.
             self.setPixmap(
                 self.pixmap().scaled(
                     self.width(),
                     self.height(),
                     Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
+                    Qt.TransformationMode.FastTransformation,
                 )
             )
 
@@ -100,7 +294,7 @@ class CameraPreviewWidget(QLabel):
 class CalibrationWorker(QObject):
     """Background QObject that captures a baseline posture sample on a worker QThread.
 
-    Opens the camera, runs PoseDetector for ``duration_seconds`` (default:
+    Reads the wizard's SharedCamera, runs PoseDetector for ``duration_seconds`` (default:
     CALIBRATION_DURATION_SECONDS = 6), averages posture_score / neck_angle /
     shoulder_vertical_delta across collected frames, and emits either
     ``finished(CalibrationResult)`` or ``failed(str)``.
@@ -115,14 +309,21 @@ class CalibrationWorker(QObject):
     def __init__(
         self,
         settings: SettingsService,
+        camera: SharedCamera,
         duration_seconds: int = CALIBRATION_DURATION_SECONDS,
+        detector: Optional[PoseDetector] = None,
     ) -> None:
         super().__init__()
         self._settings = settings
+        self._camera = camera
+        # The app's warmed-up detector when available; otherwise built in run()
+        self._detector = detector
         self._duration = duration_seconds
         self._stop = False
+        self._capture: Optional[cv2.VideoCapture] = None
 
     def cancel(self) -> None:
+        """Ask the worker to stop; honoured on its next timer tick."""
         self._stop = True
 
     @property
@@ -131,80 +332,105 @@ class CalibrationWorker(QObject):
 
     @pyqtSlot()
     def run(self) -> None:
-        capture = None
-        try:
-            camera_id = self._settings.runtime.default_camera_id
-            capture = cv2.VideoCapture(camera_id)
-            if not capture.isOpened() and sys.platform == "darwin":
-                capture.release()
-                capture = cv2.VideoCapture(camera_id, cv2.CAP_AVFOUNDATION)
+        """Open the camera and start sampling from the worker thread's event loop.
 
-            if not capture or not capture.isOpened():
+        Each sample is taken by a QTimer tick rather than a blocking loop, so the
+        thread sleeps in its event loop between samples and a cancel or
+        thread.quit() takes effect at the next tick.
+        """
+        try:
+            self._capture = self._camera.acquire()
+            if self._capture is None:
                 self.failed.emit(
                     QApplication.translate(
                         "CalibrationWorker", "Unable to access camera"
                     )
                 )
                 return
-
-            detector = PoseDetector(self._settings)
-            start_time = time.time()
-            collected: Dict[str, list] = {
-                "posture_score": [],
-                "neck_angle": [],
-                "shoulder_delta": [],
-            }
-
-            while not self._stop and time.time() - start_time < self._duration:
-                ret, frame = capture.read()
-                if not ret:
-                    time.sleep(0.05)
-                    continue
-                _, score, result_bundle = detector.process_frame(frame)
-                if not result_bundle:
-                    time.sleep(0.05)
-                    continue
-                metrics = (
-                    result_bundle.metrics if hasattr(result_bundle, "metrics") else {}
-                )
-                collected["posture_score"].append(metrics.get("posture_score", score))
-                collected["neck_angle"].append(metrics.get("neck_angle", 0.0))
-                collected["shoulder_delta"].append(
-                    metrics.get("shoulder_vertical_delta", 0.0)
-                )
-                time.sleep(0.05)
-
+            if self._detector is None:
+                self._detector = PoseDetector(self._settings)
         except Exception as exc:  # noqa: BLE001 - propagate error to UI
             self.failed.emit(str(exc))
             return
-        finally:
-            if capture:
-                capture.release()
 
+        self._start_time = time.monotonic()
+        # Running totals; only the means are reported, so samples aren't kept
+        self._totals = [0.0, 0.0, 0.0]
+        self._sample_count = 0
+        # Metrics and grey thumbnail of the last frame the detector scored
+        self._last_sample: Optional[tuple] = None
+        self._last_thumb: Optional[np.ndarray] = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._sample)
+        self._timer.start(int(_CALIBRATION_SAMPLE_INTERVAL_S * 1000))
+
+    def _sample(self) -> None:
         if self._stop:
-            self.failed.emit(
+            self._finish(
                 QApplication.translate("CalibrationWorker", "Calibration cancelled")
             )
             return
-
-        if not collected["posture_score"]:
+        if time.monotonic() - self._start_time >= self._duration:
+            self._finish()
+            return
+        try:
+            sample = self._measure()
+        except Exception as exc:  # noqa: BLE001 - propagate error to UI
+            self._finish(str(exc))
+            return
+        if sample is None:
+            return
+        for index, value in enumerate(sample):
+            self._totals[index] += value
+        self._sample_count += 1
+
+    def _measure(self) -> Optional[tuple]:
+        """Return (score, neck angle, shoulder delta) for the newest frame, if any."""
+        # With a one-frame driver buffer, grab() returns the latest frame at once
+        if not self._capture.grab():
+            return None
+        ret, frame = self._capture.retrieve()
+        if not ret:
+            return None
+        # The user holds still during calibration; if the scene has not changed,
+        # the previous sample's metrics stand in for a detector run
+        thumb = cv2.cvtColor(np.ascontiguousarray(frame[::8, ::8]), cv2.COLOR_BGR2GRAY)
+        last_thumb = self._last_thumb
+        if (
+            self._last_sample is not None
+            and last_thumb.shape == thumb.shape
+            and cv2.mean(cv2.absdiff(thumb, last_thumb))[0]
+            < _CALIBRATION_STILL_FRAME_MAD
+        ):
+            return self._last_sample
+        # Only the metrics are used, so skip process_frame()'s overlay drawing
+        metrics = self._detector.measure_frame(frame)
+        if metrics is None:
+            self._last_sample = None
+            return None
+        sample = _calibration_sample(metrics)
+        self._last_sample, self._last_thumb = sample, thumb
+        return sample
+
+    def _finish(self, error: Optional[str] = None) -> None:
+        self._timer.stop()
+        if error is not None:
+            self.failed.emit(error)
+            return
+        count = self._sample_count
+        if not count:
             self.failed.emit(
                 QApplication.translate("CalibrationWorker", "No posture data captured")
             )
             return
-
-        result = CalibrationResult(
-            posture_score=float(
-                sum(collected["posture_score"]) / len(collected["posture_score"])
-            ),
-            neck_angle=float(
-                sum(collected["neck_angle"]) / len(collected["neck_angle"])
-            ),
-            shoulder_delta=float(
-                sum(collected["shoulder_delta"]) / len(collected["shoulder_delta"])
-            ),
+        score_total, neck_total, shoulder_total = self._totals
+        self.finished.emit(
+            CalibrationResult(
+                posture_score=float(score_total / count),
+                neck_angle=float(neck_total / count),
+                shoulder_delta=float(shoulder_total / count),
+            )
         )
-        self.finished.emit(result)
 
 
 class WelcomePage(QWizardPage):
@@ -248,22 +474,26 @@ class WelcomePage(QWizardPage):
 class CameraSetupPage(QWizardPage):
     """Wizard page showing a live camera preview for framing guidance.
 
-    Starts CameraPreviewWidget when the page is entered and stops it on exit
-    to release the capture handle before CalibrationWorker opens the same camera.
+    Starts CameraPreviewWidget when the page is entered and stops it on exit so
+    CalibrationWorker can read the same SharedCamera without contention. The
+    preview widget and its camera are only set up once the page is reached.
     """
 
     def __init__(
-        self, settings: SettingsService, parent: Optional[QWidget] = None
+        self,
+        settings: SettingsService,
+        camera: SharedCamera,
+        parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
         self._settings = settings
+        self._camera = camera
         self.setTitle(self.tr("Align your camera"))
         self.setSubTitle(
             self.tr("Center yourself and ensure your upper body is in frame.")
         )
 
-        self.preview = CameraPreviewWidget()
-        self.preview.setMinimumHeight(240)
+        self.preview: Optional[CameraPreviewWidget] = None
 
         guidance = QLabel(
             self.tr(
@@ -272,22 +502,26 @@ class CameraSetupPage(QWizardPage):
         )
         guidance.setWordWrap(True)
 
-        layout = QVBoxLayout()
-        layout.addWidget(self.preview)
-        layout.addSpacing(8)
-        layout.addWidget(guidance)
-        layout.addStretch(1)
-        self.setLayout(layout)
+        self._layout = QVBoxLayout()
+        self._layout.addSpacing(8)
+        self._layout.addWidget(guidance)
+        self._layout.addStretch(1)
+        self.setLayout(self._layout)
 
     def initializePage(self) -> None:  # noqa: N802 - Qt override
-        self.preview.start(self._settings.runtime.default_camera_id)
+        if self.preview is None:
+            self.preview = CameraPreviewWidget()
+            self.preview.setMinimumHeight(240)
+            self._layout.insertWidget(0, self.preview)
+        self.preview.start(self._camera)
 
     def cleanupPage(self) -> None:  # noqa: N802 - Qt override
-        self.preview.stop()
+        self.stop_preview()
 
     def stop_preview(self) -> None:
-        """Ensures the preview capture is released when leaving the page."""
-        self.preview.stop()
+        """Stops reading frames when leaving the page; the camera stays open."""
+        if self.preview is not None:
+            self.preview.stop()
 
 
 class CalibrationPage(QWizardPage):
@@ -299,10 +533,16 @@ class CalibrationPage(QWizardPage):
     """
 
     def __init__(
-        self, settings: SettingsService, parent: Optional[QWidget] = None
+        self,
+        settings: SettingsService,
+        camera: SharedCamera,
+        detector_provider: Optional[Callable[[], PoseDetector]] = None,
+        parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
         self._settings = settings
+        self._camera = camera
+        self._detector_provider = detector_provider
         self.setTitle(self.tr("Capture your baseline"))
         self.setSubTitle(
             self.tr(
@@ -345,7 +585,8 @@ class CalibrationPage(QWizardPage):
             self.tr("Collecting data... Keep still for six seconds.")
         )
 
-        worker = CalibrationWorker(self._settings)
+        detector = self._detector_provider() if self._detector_provider else None
+        worker = CalibrationWorker(self._settings, self._camera, detector=detector)
         thread = QThread(self)
         worker.moveToThread(thread)
 
@@ -418,6 +659,16 @@ class CalibrationPage(QWizardPage):
         if _is_alive(worker):
             worker.deleteLater()
 
+    def cleanupPage(self) -> None:  # noqa: N802 - Qt override
+        # Going back re-starts the preview on the shared camera; stop reading first.
+        # The page is being left, so the cancelled worker's result is not shown.
+        if self._worker and not sip.isdeleted(self._worker):
+            self._worker.finished.disconnect(self._handle_success)
+            self._worker.failed.disconnect(self._handle_failure)
+            self._worker.cancel()
+        self._cleanup_worker()
+        self.start_button.setEnabled(True)
+
     def isComplete(self) -> bool:  # noqa: N802 - Qt override
         return self._metrics is not None
 
@@ -427,7 +678,10 @@ class CalibrationPage(QWizardPage):
 
 class OnboardingWizard(QWizard):
     def __init__(
-        self, settings_service: SettingsService, parent: Optional[QWidget] = None
+        self,
+        settings_service: SettingsService,
+        parent: Optional[QWidget] = None,
+        detector_provider: Optional[Callable[[], PoseDetector]] = None,
     ) -> None:
         super().__init__(parent)
         self._settings = settings_service
@@ -436,9 +690,13 @@ class OnboardingWizard(QWizard):
         self.setWizardStyle(QWizard.WizardStyle.ModernStyle)
         self.setMinimumWidth(500)
 
+        # Opened on first use and released only when the wizard closes
+        self._camera = SharedCamera(settings_service)
         self.welcome_page = WelcomePage()
-        self.camera_page = CameraSetupPage(settings_service)
-        self.calibration_page = CalibrationPage(settings_service)
+        self.camera_page = CameraSetupPage(settings_service, self._camera)
+        self.calibration_page = CalibrationPage(
+            settings_service, self._camera, detector_provider
+        )
 
         self._welcome_page_id = self.addPage(self.welcome_page)
         self._camera_page_id = self.addPage(self.camera_page)
@@ -461,6 +719,12 @@ class OnboardingWizard(QWizard):
             self._metrics = metrics
         super().accept()
 
+    def done(self, result: int) -> None:
+        self.camera_page.stop_preview()
+        self.calibration_page.cleanupPage()
+        self._camera.release()
+        super().done(result)
+
     def collected_metrics(self) -> Optional[CalibrationResult]:
         return self._metrics
 
@@ -471,9 +735,12 @@ class OnboardingWizard(QWizard):
 
 
 def run_onboarding_if_needed(
-    settings_service: SettingsService, parent: Optional[QWidget] = None
+    settings_service: SettingsService,
+    parent: Optional[QWidget] = None,
+    detector_provider: Optional[Callable[[], PoseDetector]] = None,
 ) -> bool:
+    """Show the wizard on first run; *detector_provider* supplies a shared detector."""
     if settings_service.profile.has_completed_onboarding:
         return False
-    wizard = OnboardingWizard(settings_service, parent)
+    wizard = OnboardingWizard(settings_service, parent, detector_provider)
     return wizard.exec() == QDialog.DialogCode.Accepted
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import cv2
@@ -30,8 +31,42 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from services.camera_service import NATIVE_BACKEND
 from services.settings_service import SettingsService
 
+# Every style rule for the dialog, applied once at the top so Qt parses one
+# sheet instead of one per label; widgets opt in through their object names
+_DIALOG_STYLESHEET = """
+QFrame#heroCard {
+    background-color: #f4f6fa;
+    border: 1px solid #d6d9e0;
+    border-radius: 8px;
+    padding: 12px;
+}
+QLabel#heroSubtitle, QLabel#heroSummary {
+    color: #50535a;
+}
+QLabel#helpLabel {
+    color: #5e6066;
+}
+QLabel#errorLabel {
+    color: #c13434;
+}
+"""
+
+
+def _probe_camera(index: int) -> bool:
+    # Same backend and fallback tracking opens with, so the list matches what
+    # will work
+    cap = cv2.VideoCapture(index, NATIVE_BACKEND)
+    if not cap.isOpened() and NATIVE_BACKEND != cv2.CAP_ANY:
+        cap.release()
+        cap = cv2.VideoCapture(index)
+    try:
+        return cap.isOpened()
+    finally:
+        cap.release()
+
 
 class SettingsDialog(QDialog):
     """Multi-section settings dialog for Camera, Notifications, Tracking, and Advanced tuning.
@@ -62,9 +97,12 @@ class SettingsDialog(QDialog):
         self.ml_settings = settings_service.ml
         self.profile_settings = settings_service.profile
         self.validation_errors: Dict[str, str] = {}
+        # Shared by every help label; built from the first label's font
+        self._help_font: Optional[QFont] = None
 
         self.setWindowTitle("Posture Settings")
         self.resize(760, 560)
+        self.setStyleSheet(_DIALOG_STYLESHEET)
 
         self.hero_card = self._build_hero_card()
         self.section_list = self._build_section_list()
@@ -110,7 +148,7 @@ class SettingsDialog(QDialog):
         title.setFont(title_font)
 
         subtitle = QLabel("Tune camera, alerts, and tracking in one place.")
-        subtitle.setStyleSheet("color: #50535a;")
+        subtitle.setObjectName("heroSubtitle")
 
         summary = QLabel(self._summary_text())
         summary.setObjectName("heroSummary")
@@ -127,19 +165,6 @@ class SettingsDialog(QDialog):
             self.show_advanced_checkbox, alignment=Qt.AlignmentFlag.AlignRight
         )
 
-        card.setStyleSheet(
-            """
-            QFrame#heroCard {
-                background-color: #f4f6fa;
-                border: 1px solid #d6d9e0;
-                border-radius: 8px;
-                padding: 12px;
-            }
-            QLabel#heroSummary {
-                color: #50535a;
-            }
-            """
-        )
         self.hero_summary_label = summary
         return card
 
@@ -446,15 +471,16 @@ class SettingsDialog(QDialog):
     def _help_label(self, text: str) -> QLabel:
         label = QLabel(text)
         label.setWordWrap(True)
-        help_font = QFont(label.font())
-        help_font.setPointSize(max(help_font.pointSize() - 1, 8))
-        label.setFont(help_font)
-        label.setStyleSheet("color: #5e6066;")
+        if self._help_font is None:
+            self._help_font = QFont(label.font())
+            self._help_font.setPointSize(max(self._help_font.pointSize() - 1, 8))
+        label.setFont(self._help_font)
+        label.setObjectName("helpLabel")
         return label
 
     def _error_label(self) -> QLabel:
         label = QLabel("")
-        label.setStyleSheet("color: #c13434;")
+        label.setObjectName("errorLabel")
         label.setWordWrap(True)
         label.setVisible(False)
         return label
@@ -502,13 +528,11 @@ class SettingsDialog(QDialog):
             self._clear_error("tracking_intervals", self.interval_error_label)
 
     def _available_cameras(self, max_index: int = 5):
-        available = []
-        for i in range(max_index):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                available.append((i, f"Camera {i}"))
-            cap.release()
-        return available
+        # Opening a missing index can take hundreds of milliseconds to fail, so
+        # probe all indices at once; map() keeps the results in index order.
+        with ThreadPoolExecutor(max_workers=max_index) as pool:
+            found = list(pool.map(_probe_camera, range(max_index)))
+        return [(i, f"Camera {i}") for i, ok in enumerate(found) if ok]
 
     def _show_error(self, key: str, label: QLabel, message: str) -> None:
         self.validation_errors[key] = message
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import itertools
 import json
 import logging
-from typing import Dict, Iterable, Mapping, Optional
+import signal
+import socket
+from typing import Callable, Dict, Iterable, Mapping, Optional
+import time
 from datetime import datetime, timedelta
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QSocketNotifier, Qt, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QAction, QActionGroup, QIcon
 from PyQt6.QtWidgets import (
     QApplication,
@@ -30,13 +34,22 @@ from services.task_scheduler import TaskScheduler
 from ui.dashboard import PostureDashboard, score_grade
 from ui.onboarding import run_onboarding_if_needed
 from ui.settings_dialog import SettingsDialog
-from util__create_score_icon import create_score_icon
+from util__create_score_icon import cached_score_icon
 
 logger = logging.getLogger(__name__)
 
 # How long (minutes) of continuous tracking before suggesting a break
 _BREAK_REMINDER_MINUTES = BREAK_REMINDER_MINUTES
 
+# Delay before the first scan after startup or an interval change
+_INTERVAL_START_DELAY_MS = 1000
+
+# Minimum spacing of tracking updates while no dashboard is showing frames
+_HIDDEN_UPDATE_INTERVAL_S = 0.2
+
+# Menu toggles persist after this quiet period so rapid clicks cause one write
+_SETTINGS_SAVE_DELAY_MS = 500
+
 
 class PostureTrackerTray(QSystemTrayIcon):
     """Main application controller embedded in the system tray.
@@ -45,15 +58,22 @@ class PostureTrackerTray(QSystemTrayIcon):
     the camera → scoring → notification pipeline, manages the dashboard window and
     settings dialog, and handles graceful shutdown.
 
-    Frame updates run on a 100 ms QTimer; interval checks run on a 1 s QTimer (both
-    via TaskScheduler). Settings reloads use CameraService.pause_processing() to avoid
-    mutating shared state while the camera thread is mid-frame.
+    Frame updates are pushed by CameraService through a queued signal, so the GUI
+    thread only wakes when a new frame exists; scheduled scans are armed as
+    single-shot TaskScheduler timers at the next deadline. Settings reloads use
+    CameraService.pause_processing() to avoid mutating shared state while the
+    camera thread is mid-frame.
     """
 
+    # Emitted from the camera thread; Qt queues delivery onto the GUI thread
+    _frame_ready = pyqtSignal()
+    # Emitted from a pool thread with (dashboard, saved scores)
+    _history_loaded = pyqtSignal(object, object)
+
     def __init__(
         self,
         settings: SettingsService,
-        detector: PoseDetector,
+        detector_provider: Callable[[], PoseDetector],
         camera_service: CameraService,
         score_service: ScoreService,
         notification_service: NotificationService,
@@ -63,7 +83,8 @@ class PostureTrackerTray(QSystemTrayIcon):
     ) -> None:
         super().__init__(parent)
         self._settings = settings
-        self._detector = detector
+        # Resolved on first tracking start; the detector warms up in the background
+        self._detector_provider = detector_provider
         self._camera_service = camera_service
         self._scores = score_service
         self._notifications = notification_service
@@ -75,17 +96,31 @@ class PostureTrackerTray(QSystemTrayIcon):
         # Default to 30-minute intervals so the camera isn't running all day.
         # Users can switch to "Continuous (always on)" from the interval menu.
         self.tracking_interval = 30
-        self.last_tracking_time: Optional[datetime] = None
-        self.last_db_save: Optional[datetime] = None
-        self._continuous_tracking_start: Optional[datetime] = None
+        # time.monotonic() stamps — immune to wall-clock jumps, no datetime churn
+        self.last_tracking_time: Optional[float] = None
+        self.last_db_save: Optional[float] = None
+        self._continuous_tracking_start: Optional[float] = None
         self._break_reminder_sent = False
-        self._last_icon_score: float = -1.0
+        # Integer score currently shown on the tray icon
+        self._last_icon_bucket: Optional[int] = None
+        # Tooltip text last handed to the tray host
+        self._last_tooltip: Optional[str] = None
+        # Set while a frame notification is queued so bursts collapse into one update
+        self._frame_update_pending = False
+        self._last_frame_update = 0.0
+        # True while an open, unminimised dashboard is showing every frame
+        self._dashboard_wants_frames = False
+        # Last preview handed to the dashboard, to skip re-sending the same buffer
+        self._last_preview_sequence = -1
 
         self._initialize_application()
         self._run_onboarding_if_needed()
+        self._cache_runtime_settings()
         self._setup_tray_menu()
-        self._scheduler.schedule("frame", 100, self._update_tracking)
-        self._scheduler.schedule("interval", 1000, self._check_interval)
+        self._frame_ready.connect(self._update_tracking)
+        self._history_loaded.connect(self._apply_dashboard_history)
+        self._camera_service.set_frame_listener(self._notify_frame_ready)
+        self._schedule_next_scan(_INTERVAL_START_DELAY_MS)
         self._setup_signal_handling()
 
     def _initialize_application(self) -> None:
@@ -94,32 +129,33 @@ class PostureTrackerTray(QSystemTrayIcon):
         icon_path = self._settings.resources.icon_path
         self.icon_path = icon_path
         icon = QIcon(icon_path)
+        # Decoded once and reused whenever tracking stops
+        self._default_icon = icon
         app.setWindowIcon(icon)
         self.setIcon(icon)
-        self.setToolTip("BatesPosture — idle")
+        self._set_tooltip("BatesPosture — idle")
+
+    def _cache_runtime_settings(self) -> None:
+        """Copy the timing settings read on the tracking path into attributes."""
+        runtime = self._settings.runtime
+        self._db_interval_s = float(runtime.db_write_interval_seconds)
+        self._tracking_duration_ms = runtime.tracking_duration_minutes * 60 * 1000
 
     def _run_onboarding_if_needed(self) -> None:
-        if run_onboarding_if_needed(self._settings):
+        if run_onboarding_if_needed(
+            self._settings, detector_provider=self._detector_provider
+        ):
             self._settings.save_all()
 
     def _setup_tray_menu(self) -> None:
         menu = QMenu()
-        style = QApplication.style()
 
-        self.toggle_tracking_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay),
-            "Start Tracking",
-            self,
-        )
+        self.toggle_tracking_action = QAction("Start Tracking", self)
         self.toggle_tracking_action.setShortcut("Ctrl+Shift+T")
         self.toggle_tracking_action.triggered.connect(self.toggle_tracking)
         self.toggle_tracking_action.setShortcutVisibleInContextMenu(True)
 
-        self.toggle_dashboard_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_DesktopIcon),
-            "Show Dashboard",
-            self,
-        )
+        self.toggle_dashboard_action = QAction("Show Dashboard", self)
         self.toggle_dashboard_action.setShortcut("Ctrl+Shift+D")
         self.toggle_dashboard_action.setShortcutVisibleInContextMenu(True)
         self.toggle_dashboard_action.triggered.connect(self.toggle_dashboard)
@@ -129,16 +165,22 @@ class PostureTrackerTray(QSystemTrayIcon):
         menu.addAction(self.toggle_tracking_action)
         menu.addAction(self.toggle_dashboard_action)
 
-        self.interval_menu = self._create_interval_menu(menu)
-        self.interval_menu.setIcon(
-            style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
-        )
+        self.interval_menu = QMenu("Tracking Interval", menu)
+        self._interval_group = QActionGroup(self.interval_menu)
+        self._interval_group.setExclusive(True)
+        # One slot for the whole group; each action carries its minutes in data()
+        self._interval_group.triggered.connect(self._on_interval_triggered)
+        self._interval_actions: Dict[str, QAction] = {}
+        # First action per interval length, so re-checking needs no data() calls
+        self._interval_action_by_minutes: Dict[int, QAction] = {}
+        # Raw interval mapping the menu was last built from
+        self._synced_intervals: Optional[dict] = None
+        self._sync_interval_menu()
         self.interval_menu_action = menu.addMenu(self.interval_menu)
 
         runtime = self._settings.runtime
         menu.addSection("Quick toggles")
         self.notifications_toggle_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation),
             "Notifications",
             self,
             checkable=True,
@@ -148,7 +190,6 @@ class PostureTrackerTray(QSystemTrayIcon):
         self._set_notification_label(runtime.notifications_enabled)
 
         self.logging_toggle_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_DriveHDIcon),
             "Database Logging",
             self,
             checkable=True,
@@ -158,7 +199,6 @@ class PostureTrackerTray(QSystemTrayIcon):
         self._set_logging_label(runtime.enable_database_logging)
 
         self.focus_mode_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_DialogNoButton),
             "Focus Mode",
             self,
             checkable=True,
@@ -173,29 +213,20 @@ class PostureTrackerTray(QSystemTrayIcon):
 
         menu.addSeparator()
 
-        self.settings_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView),
-            "Settings",
-            menu,
-        )
+        self.settings_action = QAction("Settings", menu)
         self.settings_action.setShortcut("Ctrl+,")
         self.settings_action.setShortcutVisibleInContextMenu(True)
         self.settings_action.triggered.connect(self.open_settings)
         menu.addAction(self.settings_action)
 
         # Export action (enabled when DB logging is on)
-        self.export_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton),
-            "Export Data as CSV…",
-            menu,
-        )
+        self.export_action = QAction("Export Data as CSV…", menu)
         self.export_action.triggered.connect(self._export_csv)
         self.export_action.setEnabled(runtime.enable_database_logging)
         menu.addAction(self.export_action)
 
         menu.addSeparator()
         quit_action = QAction(
-            style.standardIcon(QStyle.StandardPixmap.SP_TitleBarCloseButton),
             "Quit",
             menu,
             triggered=self.quit_application,
@@ -204,30 +235,90 @@ class PostureTrackerTray(QSystemTrayIcon):
         quit_action.setShortcutVisibleInContextMenu(True)
         menu.addAction(quit_action)
 
+        # Style icons are looked up the first time the menu opens rather than
+        # while the tray is starting up
+        self._pending_menu_icons = [
+            (self.toggle_tracking_action, QStyle.StandardPixmap.SP_MediaPlay),
+            (self.toggle_dashboard_action, QStyle.StandardPixmap.SP_DesktopIcon),
+            (self.interval_menu, QStyle.StandardPixmap.SP_BrowserReload),
+            (
+                self.notifications_toggle_action,
+                QStyle.StandardPixmap.SP_MessageBoxInformation,
+            ),
+            (self.logging_toggle_action, QStyle.StandardPixmap.SP_DriveHDIcon),
+            (self.focus_mode_action, QStyle.StandardPixmap.SP_DialogNoButton),
+            (self.settings_action, QStyle.StandardPixmap.SP_FileDialogDetailedView),
+            (self.export_action, QStyle.StandardPixmap.SP_DialogSaveButton),
+            (quit_action, QStyle.StandardPixmap.SP_TitleBarCloseButton),
+        ]
+        menu.aboutToShow.connect(self._apply_menu_icons)
+
         self.setContextMenu(menu)
         self.setVisible(True)
 
-    def _create_interval_menu(self, parent_menu: QMenu) -> QMenu:
-        interval_menu = QMenu("Tracking Interval", parent_menu)
-        interval_group = QActionGroup(interval_menu)
-        interval_group.setExclusive(True)
+    def _apply_menu_icons(self) -> None:
+        """Give the menu entries their style icons; runs once, on first open."""
+        if not self._pending_menu_icons:
+            return
+        style = QApplication.style()
+        for target, pixmap in self._pending_menu_icons:
+            target.setIcon(style.standardIcon(pixmap))
+        self._pending_menu_icons = []
+
+    def _sync_interval_menu(self) -> None:
+        """Bring the interval submenu in line with settings, reusing existing actions.
+
+        When the configured intervals are unchanged since the last sync only the
+        checked state is refreshed.
+        """
+        raw_intervals = self._settings.runtime.tracking_intervals
+        if raw_intervals == self._synced_intervals:
+            action = self._interval_action_by_minutes.get(self.tracking_interval)
+            if action is not None:
+                action.setChecked(True)
+            return
+        intervals = self._normalize_tracking_intervals(raw_intervals)
+        stale = [label for label in self._interval_actions if label not in intervals]
+        for label in stale:
+            action = self._interval_actions.pop(label)
+            self._interval_group.removeAction(action)
+            self.interval_menu.removeAction(action)
+            action.deleteLater()
 
-        intervals = self._normalize_tracking_intervals(
-            self._settings.runtime.tracking_intervals
-        )
         for label, minutes in intervals.items():
-            action = QAction(label, interval_menu, checkable=True)
+            action = self._interval_actions.get(label)
+            if action is None:
+                action = QAction(label, self.interval_menu, checkable=True)
+                self._interval_group.addAction(action)
+                self.interval_menu.addAction(action)
+                self._interval_actions[label] = action
             action.setData(minutes)
-            action.triggered.connect(lambda checked, m=minutes: self.set_interval(m))
-            if minutes == 0:
-                action.setToolTip(
-                    "Camera stays on continuously — higher CPU and battery use."
-                )
-            interval_menu.addAction(action)
-            interval_group.addAction(action)
+            action.setToolTip(
+                "Camera stays on continuously — higher CPU and battery use."
+                if minutes == 0
+                else ""
+            )
             if minutes == self.tracking_interval:
                 action.setChecked(True)
-        return interval_menu
+
+        if list(self._interval_actions) != list(intervals):
+            # New or reordered labels: re-append so the menu follows settings order
+            for label in intervals:
+                action = self._interval_actions[label]
+                self.interval_menu.removeAction(action)
+                self.interval_menu.addAction(action)
+            self._interval_actions = {
+                label: self._interval_actions[label] for label in intervals
+            }
+        self._interval_action_by_minutes = {}
+        for label, minutes in intervals.items():
+            self._interval_action_by_minutes.setdefault(
+                minutes, self._interval_actions[label]
+            )
+        self._synced_intervals = dict(self._settings.runtime.tracking_intervals)
+
+    def _on_interval_triggered(self, action: QAction) -> None:
+        self.set_interval(int(action.data()))
 
     def _normalize_tracking_intervals(self, raw_intervals: object) -> Dict[str, int]:
         normalized = self._coerce_interval_mapping(raw_intervals)
@@ -304,9 +395,36 @@ class PostureTrackerTray(QSystemTrayIcon):
             return None
 
     def _setup_signal_handling(self) -> None:
-        import signal
+        """Deliver SIGINT through the Qt event loop.
+
+        Python only runs signal handlers between bytecodes, and Qt's C++ loop
+        can sit idle for a long time. The C-level handler writes the signal
+        number to a socket the loop watches, which wakes it straight away.
+        """
+        self._signal_reader, self._signal_writer = socket.socketpair()
+        self._signal_reader.setblocking(False)
+        self._signal_writer.setblocking(False)
+        try:
+            signal.set_wakeup_fd(self._signal_writer.fileno())
+        except ValueError:
+            # Not the main thread (e.g. embedded); fall back to the plain handler
+            signal.signal(signal.SIGINT, self._signal_handler)
+            return
+        self._signal_notifier = QSocketNotifier(
+            self._signal_reader.fileno(), QSocketNotifier.Type.Read, self
+        )
+        self._signal_notifier.activated.connect(self._on_signal_wakeup)
+        # Quitting happens in _on_signal_wakeup; the Python handler only stops
+        # the default KeyboardInterrupt from firing inside Qt callbacks
+        signal.signal(signal.SIGINT, lambda *_: None)
 
-        signal.signal(signal.SIGINT, self._signal_handler)
+    def _on_signal_wakeup(self) -> None:
+        try:
+            data = self._signal_reader.recv(64)
+        except OSError:
+            return
+        if signal.SIGINT in data:
+            self.quit_application()
 
     # ------------------------
     # Tracking lifecycle
@@ -318,31 +436,40 @@ class PostureTrackerTray(QSystemTrayIcon):
             self._stop_tracking()
 
     def _start_tracking(self) -> None:
-        started = self._camera_service.start(self._detector.process_frame)
+        detector = self._detector_provider()
+        started = self._camera_service.start(detector.process_frame)
         if not started:
             return
         self._scores.reset_session()
         self.tracking_enabled = True
-        self._continuous_tracking_start = datetime.now()
+        self._continuous_tracking_start = time.monotonic()
         self._break_reminder_sent = False
         self.toggle_tracking_action.setText("Stop Tracking")
         self.toggle_dashboard_action.setEnabled(True)
-        self.setIcon(create_score_icon(0))
+        self._set_score_icon(0)
         logger.info("Tracking started")
 
     def _stop_tracking(self) -> None:
         self._camera_service.stop()
         self.tracking_enabled = False
         self._continuous_tracking_start = None
-        self._last_icon_score = -1.0
+        self._last_icon_bucket = None
         self.toggle_tracking_action.setText("Start Tracking")
         self.toggle_dashboard_action.setEnabled(False)
         self.toggle_dashboard_action.setText("Show Dashboard")
         if self.video_window:
             self.video_window.close()
             self.video_window = None
-        self.setIcon(QIcon(self.icon_path))
-        self.setToolTip("BatesPosture — idle")
+        self.setIcon(self._default_icon)
+        if self.tracking_interval > 0 and self.last_tracking_time is not None:
+            remaining_s = (
+                self.last_tracking_time + self.tracking_interval * 60 - time.monotonic()
+            )
+            # Wall-clock time is only needed here, for display
+            next_scan = datetime.now() + timedelta(seconds=max(remaining_s, 0.0))
+            self._set_tooltip(f"Next scan at {next_scan:%H:%M}")
+        else:
+            self._set_tooltip("BatesPosture — idle")
         logger.info("Tracking stopped")
 
     def toggle_dashboard(self) -> None:
@@ -352,73 +479,138 @@ class PostureTrackerTray(QSystemTrayIcon):
             self.toggle_dashboard_action.setText("Show Dashboard")
         else:
             profile = self._settings.profile
-            history = None
-            if self._database:
-                rows = self._database.load_dashboard_history()
-                history = [score for _, score in rows]
             self.video_window = PostureDashboard(
                 baseline_score=profile.baseline_posture_score,
                 preferred_theme=profile.preferred_theme,
                 baseline_neck_angle=profile.baseline_neck_angle,
                 baseline_shoulder_level=profile.baseline_shoulder_level,
-                history=history,
             )
+            if self._database:
+                # Saved history is read on a pool thread while the window is
+                # built and shown, then merged in on the GUI thread
+                window, database = self.video_window, self._database
+                QThreadPool.globalInstance().start(
+                    lambda: self._history_loaded.emit(
+                        window, database.load_dashboard_scores()
+                    )
+                )
             self.video_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
             self.video_window.destroyed.connect(self._on_dashboard_closed)
             self.video_window.resize(720, 560)
             self.video_window.show()
             self.toggle_dashboard_action.setText("Hide Dashboard")
 
+    def _apply_dashboard_history(self, window: object, scores: object) -> None:
+        # The dashboard may have been closed, or replaced, while loading
+        if window is self.video_window and scores:
+            self.video_window.prepend_history(scores)
+
+    def _show_dashboard_frame(self) -> None:
+        """Hand the dashboard a frame already scaled on the camera thread.
+
+        Nothing is scaled or painted while the window is hidden or minimised,
+        and a preview that was already shown is not sent again.
+        """
+        window = self.video_window
+        if not window.isVisible() or window.isMinimized():
+            self._dashboard_wants_frames = False
+            self._camera_service.set_preview_size(None)
+            return
+        self._dashboard_wants_frames = True
+        self._camera_service.set_preview_size(window.preview_size())
+        sequence, preview = self._camera_service.get_preview_snapshot()
+        if preview is None or sequence == self._last_preview_sequence:
+            return
+        self._last_preview_sequence = sequence
+        window.update_frame(preview)
+
     def _on_dashboard_closed(self) -> None:
+        self._camera_service.set_preview_size(None)
+        self._dashboard_wants_frames = False
+        self._last_preview_sequence = -1
         if self._database and isinstance(self.video_window, PostureDashboard):
-            import time as _time
-
             scores = self.video_window.get_history()
-            now = _time.time()
-            step = 1.0
-            pairs = [
-                (now - (len(scores) - i - 1) * step, s) for i, s in enumerate(scores)
-            ]
+            # One second apart, ending now; counted up rather than recomputed per sample
+            first = time.time() - (len(scores) - 1)
+            pairs = list(zip(itertools.count(first), scores))
             self._database.save_dashboard_history(pairs)
         self.video_window = None
         self.toggle_dashboard_action.setText("Show Dashboard")
 
+    def _notify_frame_ready(self) -> None:
+        """Camera-thread hook: queue one tracking update unless one is pending.
+
+        While the dashboard is showing frames every frame is delivered; otherwise
+        only the tray icon and tooltip consume updates, so they are capped at a
+        few per second.
+        """
+        if (
+            not self._dashboard_wants_frames
+            and time.monotonic() - self._last_frame_update < _HIDDEN_UPDATE_INTERVAL_S
+        ):
+            return
+        if not self._frame_update_pending:
+            self._frame_update_pending = True
+            self._frame_ready.emit()
+
     def _update_tracking(self) -> None:
+        self._frame_update_pending = False
+        # One clock read per update, shared by the DB and break-reminder checks
+        now = time.monotonic()
+        self._last_frame_update = now
         if not self.tracking_enabled:
             return
-        frame, score = self._camera_service.get_latest_frame()
+        frame, score, results_bundle = self._camera_service.get_latest_update()
         if frame is None:
             return
 
-        results_bundle = self._camera_service.get_latest_pose_results()
-
-        if not isinstance(results_bundle, PoseDetectionResult):
+        # CameraService stores either a PoseDetectionResult or None (no person)
+        if results_bundle is None:
             # No human in frame — pause streak, skip scoring/logging/notifications.
             self._scores.mark_absent()
-            self.setToolTip("Away from desk")
+            self._set_tooltip("Away from desk")
             if isinstance(self.video_window, PostureDashboard):
-                self.video_window.update_frame(frame)
+                self._show_dashboard_frame()
             return
 
-        self._scores.add_score(score)
-        average_score, stats = self._scores.average_and_stats()
-        if abs(average_score - self._last_icon_score) >= 1.0:
-            self.setIcon(create_score_icon(average_score))
-            self._last_icon_score = average_score
+        average_score = self._scores.add_score(score)
+        stats = self._scores.session_stats()
+        self._set_score_icon(average_score)
 
         metrics: Optional[Dict[str, float]] = results_bundle.metrics
 
         if self._database and self._settings.runtime.enable_database_logging:
-            self._save_to_db(average_score, results_bundle)
+            self._save_to_db(average_score, results_bundle, now)
 
         self._notifications.maybe_notify_posture(average_score)
-        self._maybe_send_break_reminder()
+        self._maybe_send_break_reminder(now)
         self._update_tooltip(average_score)
 
         if isinstance(self.video_window, PostureDashboard):
-            self.video_window.update_frame(frame)
+            self._show_dashboard_frame()
             self.video_window.update_score(average_score, metrics, stats)
 
+    def _set_score_icon(self, score: float) -> None:
+        """Show the cached icon for *score*; no-op while the shown value is unchanged."""
+        # Clamped like cached_score_icon, so out-of-range scores that render the
+        # same icon don't count as a change
+        bucket = min(max(int(score), 0), 100)
+        if bucket == self._last_icon_bucket:
+            return
+        self.setIcon(cached_score_icon(bucket))
+        self._last_icon_bucket = bucket
+
+    def _set_tooltip(self, text: str) -> None:
+        """Set the tray tooltip unless it already shows *text*.
+
+        Each setToolTip() is forwarded to the platform tray host (a D-Bus call
+        on Linux), while the text usually repeats from frame to frame.
+        """
+        if text == self._last_tooltip:
+            return
+        self.setToolTip(text)
+        self._last_tooltip = text
+
     def _update_tooltip(self, average_score: float) -> None:
         grade = score_grade(average_score)
         streak_s = self._scores.current_streak_s
@@ -428,13 +620,13 @@ class PostureTrackerTray(QSystemTrayIcon):
             parts.append(f"🔥 {minutes}m good posture streak")
         elif streak_s >= 10:
             parts.append(f"Streak: {int(streak_s)}s")
-        self.setToolTip(" | ".join(parts))
+        self._set_tooltip(" | ".join(parts))
 
-    def _maybe_send_break_reminder(self) -> None:
+    def _maybe_send_break_reminder(self, now: float) -> None:
         if self._break_reminder_sent or self._continuous_tracking_start is None:
             return
-        elapsed = datetime.now() - self._continuous_tracking_start
-        if elapsed >= timedelta(minutes=_BREAK_REMINDER_MINUTES):
+        elapsed_s = now - self._continuous_tracking_start
+        if elapsed_s >= _BREAK_REMINDER_MINUTES * 60:
             self._notifications.notify_interval_change(
                 f"You've been sitting for {_BREAK_REMINDER_MINUTES} minutes — stand up and stretch!"
             )
@@ -450,7 +642,7 @@ class PostureTrackerTray(QSystemTrayIcon):
                 "Continuous tracking enabled — camera stays on."
             )
         else:
-            duration = self._settings.runtime.tracking_duration_minutes
+            duration = self._tracking_duration_ms // 60000
             self._notifications.notify_interval_change(
                 f"Scanning for {duration} min every {minutes} min"
             )
@@ -459,34 +651,29 @@ class PostureTrackerTray(QSystemTrayIcon):
             self.toggle_tracking()
         elif minutes > 0 and self.tracking_enabled:
             self.toggle_tracking()
+        if minutes > 0:
+            self._schedule_next_scan(_INTERVAL_START_DELAY_MS)
+        else:
+            self._scheduler.cancel("interval")
+            self._scheduler.cancel("interval_stop")
 
-    def _check_interval(self) -> None:
-        if self.tracking_interval <= 0:
-            return
-        current_time = datetime.now()
-        if not self.last_tracking_time:
-            self.last_tracking_time = current_time
-            self._start_interval_tracking()
-            return
-        elapsed = current_time - self.last_tracking_time
-        remaining = timedelta(minutes=self.tracking_interval) - elapsed
-        remaining_s = remaining.total_seconds()
-        if remaining_s <= 0:
-            self._start_interval_tracking()
-        elif not self.tracking_enabled:
-            mins = int(remaining_s // 60)
-            secs = int(remaining_s % 60)
-            self.setToolTip(f"Next scan in {mins}:{secs:02d}")
+    def _schedule_next_scan(self, delay_ms: int) -> None:
+        """Arm a single-shot timer for the next scheduled scan instead of polling."""
+        self._scheduler.schedule_once(
+            "interval", delay_ms, self._start_interval_tracking
+        )
 
     def _start_interval_tracking(self) -> None:
-        self.last_tracking_time = datetime.now()
+        if self.tracking_interval <= 0:
+            return
+        self.last_tracking_time = time.monotonic()
         self.last_db_save = None
         if not self.tracking_enabled:
             self.toggle_tracking()
-        duration_minutes = self._settings.runtime.tracking_duration_minutes
-        self._scheduler.single_shot(
-            duration_minutes * 60 * 1000, self._stop_interval_tracking
+        self._scheduler.schedule_once(
+            "interval_stop", self._tracking_duration_ms, self._stop_interval_tracking
         )
+        self._schedule_next_scan(self.tracking_interval * 60 * 1000)
 
     def _stop_interval_tracking(self) -> None:
         if self.tracking_enabled and self.tracking_interval > 0:
@@ -499,24 +686,22 @@ class PostureTrackerTray(QSystemTrayIcon):
         self,
         average_score: float,
         results_bundle: Optional[PoseDetectionResult],
+        current_time: float,
     ) -> None:
         if not self._database:
             return
-        current_time = datetime.now()
-        db_interval_seconds = self._settings.runtime.db_write_interval_seconds
+        db_interval_seconds = self._db_interval_s
 
         should_save = (
             self.tracking_interval > 0
-            and self.last_tracking_time
+            and self.last_tracking_time is not None
             and self.last_db_save is None
-            and (current_time - self.last_tracking_time).total_seconds()
-            <= db_interval_seconds
+            and current_time - self.last_tracking_time <= db_interval_seconds
         ) or (
             self.tracking_interval == 0
             and (
                 self.last_db_save is None
-                or (current_time - self.last_db_save).total_seconds()
-                >= db_interval_seconds
+                or current_time - self.last_db_save >= db_interval_seconds
             )
         )
 
@@ -524,7 +709,8 @@ class PostureTrackerTray(QSystemTrayIcon):
             return
         pose_results = results_bundle.pose_landmarks
         if pose_results:
-            self._database.save_pose_data(pose_results, average_score)
+            # Hand off to the database writer thread so SQLite never blocks the UI
+            self._database.queue_pose_data(pose_results, average_score)
             self.last_db_save = current_time
 
     def _export_csv(self) -> None:
@@ -550,12 +736,12 @@ class PostureTrackerTray(QSystemTrayIcon):
     # ------------------------
     def _toggle_notifications(self, checked: bool) -> None:
         self._settings.update_runtime(notifications_enabled=checked)
-        self._settings.save_all()
+        self._schedule_settings_save()
         self._set_notification_label(checked)
 
     def _toggle_logging(self, checked: bool) -> None:
         self._settings.update_runtime(enable_database_logging=checked)
-        self._settings.save_all()
+        self._schedule_settings_save()
         self._set_logging_label(checked)
         self.export_action.setEnabled(checked)
         if checked and self._database is None:
@@ -569,27 +755,56 @@ class PostureTrackerTray(QSystemTrayIcon):
 
     def _toggle_focus_mode(self, checked: bool) -> None:
         self._settings.update_runtime(focus_mode_enabled=checked)
-        self._settings.save_all()
+        self._schedule_settings_save()
         self._set_focus_label(checked)
 
+    def _schedule_settings_save(self) -> None:
+        """Debounce settings writes from menu toggles onto a single-shot timer."""
+        self._scheduler.schedule_once(
+            "settings_save", _SETTINGS_SAVE_DELAY_MS, self._settings.save_all
+        )
+
     def _set_notification_label(self, enabled: bool) -> None:
         label = "Notifications (On)" if enabled else "Notifications (Off)"
-        self.notifications_toggle_action.setText(label)
+        if self.notifications_toggle_action.text() != label:
+            self.notifications_toggle_action.setText(label)
 
     def _set_logging_label(self, enabled: bool) -> None:
         label = "Database Logging (On)" if enabled else "Database Logging (Off)"
-        self.logging_toggle_action.setText(label)
+        if self.logging_toggle_action.text() != label:
+            self.logging_toggle_action.setText(label)
 
     def _set_focus_label(self, enabled: bool) -> None:
         label = "Focus Mode (On)" if enabled else "Focus Mode (Off)"
-        self.focus_mode_action.setText(label)
+        if self.focus_mode_action.text() != label:
+            self.focus_mode_action.setText(label)
 
     def open_settings(self) -> None:
+        pipeline_before = self._pipeline_settings()
         dialog = SettingsDialog(self._settings)
         if dialog.exec() == QDialog.DialogCode.Accepted:  # type: ignore
-            self._refresh_after_settings_change()
+            self._refresh_after_settings_change(pipeline_before)
 
-    def _refresh_after_settings_change(self) -> None:
+    def _pipeline_settings(self) -> tuple:
+        """Snapshot the settings the capture and scoring pipeline depends on."""
+        runtime = self._settings.runtime
+        ml = self._settings.ml
+        return (
+            runtime.default_camera_id,
+            runtime.default_fps,
+            ml.score_buffer_size,
+            ml.score_window_size,
+            ml.score_threshold,
+        )
+
+    def _refresh_after_settings_change(
+        self, pipeline_before: Optional[tuple] = None
+    ) -> None:
+        """Refresh menus, and touch the pipeline only if its settings changed.
+
+        Pausing the capture loop is skipped when nothing it uses changed; the
+        camera is reopened only when a different device was selected.
+        """
         runtime = self._settings.runtime
         self._set_notification_label(runtime.notifications_enabled)
         self.notifications_toggle_action.setChecked(runtime.notifications_enabled)
@@ -598,18 +813,23 @@ class PostureTrackerTray(QSystemTrayIcon):
         self._set_focus_label(runtime.focus_mode_enabled)
         self.focus_mode_action.setChecked(runtime.focus_mode_enabled)
         self.export_action.setEnabled(runtime.enable_database_logging)
+        self._cache_runtime_settings()
 
-        menu = self.contextMenu()
-        if menu:
-            menu.removeAction(self.interval_menu_action)
-            self.interval_menu = self._create_interval_menu(menu)
-            self.interval_menu_action = menu.insertMenu(
-                self.toggle_tracking_action, self.interval_menu
-            )
+        self._sync_interval_menu()
 
+        pipeline_after = self._pipeline_settings()
+        if pipeline_after == pipeline_before:
+            return
         with self._camera_service.pause_processing():
             self._camera_service.reload_settings()
             self._scores.reload(self._settings)
+        camera_changed = (
+            pipeline_before is not None and pipeline_after[0] != pipeline_before[0]
+        )
+        if camera_changed and self.tracking_enabled:
+            # The capture handle is bound to the old device; reopen it
+            self._stop_tracking()
+            self._start_tracking()
 
     # ------------------------
     # Shutdown
@@ -620,6 +840,8 @@ class PostureTrackerTray(QSystemTrayIcon):
         if self.video_window:
             self.video_window.close()
             self.video_window = None
+        if self._scheduler.is_pending("settings_save"):
+            self._settings.save_all()
         self._scheduler.shutdown()
         if self._database:
             self._database.close()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 import cv2
 from PyQt6.QtGui import QIcon, QPixmap, QImage
@@ -8,10 +10,14 @@ _CENTER = _SIZE // 2
 _RADIUS = 30
 _OUTER = float(_RADIUS + 8)
 
-_xs, _ys = np.meshgrid(np.arange(_SIZE), np.arange(_SIZE))
-_dist = np.sqrt((_xs - _CENTER) ** 2 + (_ys - _CENTER) ** 2).astype(np.float32)
-_glow_mask = _dist <= _OUTER
-_hard_mask = _dist <= _RADIUS
+# Open grids broadcast to the full 64×64 distance map without materialising
+# two full coordinate arrays first
+_ys, _xs = np.ogrid[:_SIZE, :_SIZE]
+# Masks compare squared integer distances; the sqrt is only needed for the glow ramp
+_dist_sq = ((_xs - _CENTER) ** 2 + (_ys - _CENTER) ** 2).astype(np.int32)
+_glow_mask = _dist_sq <= int(_OUTER) ** 2
+_hard_mask = _dist_sq <= _RADIUS**2
+_dist = np.sqrt(_dist_sq.astype(np.float32))
 _glow_alpha_base = np.where(
     _glow_mask,
     np.clip((1.0 - _dist / _OUTER) * ((_OUTER - _RADIUS) / 8.0) * 255, 0, 255),
@@ -19,6 +25,43 @@ _glow_alpha_base = np.where(
 ).astype(np.uint8)
 # Final alpha channel: full opacity inside hard circle, soft glow outside
 _ALPHA_CHANNEL = np.where(_hard_mask, np.uint8(255), _glow_alpha_base).astype(np.uint8)
+# Hue 0 (red) → 60 (green) converted to BGR once for every reachable hue
+_HUE_COLORS = cv2.cvtColor(
+    np.array([[[hue, 255, 255] for hue in range(61)]], dtype=np.uint8),
+    cv2.COLOR_HSV2BGR,
+)[0]
+# Blank icon (alpha only) and the reusable draw buffer. Only text is ever drawn
+# into the buffer, so each call restores just the rows the previous one touched.
+_TEMPLATE = np.empty((_SIZE, _SIZE, 4), dtype=np.uint8)
+_TEMPLATE[:, :, :3] = 0
+_TEMPLATE[:, :, 3] = _ALPHA_CHANNEL
+_ICON_BUF = _TEMPLATE.copy()
+# QImage view over the draw buffer, created once; it reads whatever the buffer
+# holds at conversion time, so per-call wrapping is unnecessary.
+_ICON_IMAGE = QImage(
+    _ICON_BUF.data, _SIZE, _SIZE, 4 * _SIZE, QImage.Format.Format_RGBA8888
+)
+_dirty_rows = slice(0, 0)
+_FONT = cv2.FONT_HERSHEY_DUPLEX
+_THICKNESS = 3
+
+
+@lru_cache(maxsize=128)
+def _text_layout(text: str) -> tuple:
+    """Font scale, centred origin and inked row span for *text*.
+
+    getTextSize is deterministic, so the layout is computed once per label. The
+    row span covers the shadow and highlight offsets plus the stroke width.
+    """
+    font_scale = 2.0 if len(text) == 1 else (1.5 if len(text) == 2 else 1.2)
+    (text_w, text_h), baseline = cv2.getTextSize(text, _FONT, font_scale, _THICKNESS)
+    text_x = (_SIZE - text_w) // 2
+    text_y = (_SIZE + text_h) // 2
+    margin = _THICKNESS + 2
+    rows = slice(
+        max(text_y - text_h - margin, 0), min(text_y + baseline + margin, _SIZE)
+    )
+    return font_scale, text_x, text_y, rows
 
 
 def create_score_icon(score: float) -> QIcon:
@@ -27,25 +70,23 @@ def create_score_icon(score: float) -> QIcon:
     Colour mapping: HSV hue 0 (red, score=0) → 60 (green, score=100).
     Renders a hard-edge circle with a soft outer glow ring, a layered drop-shadow,
     and white score text centred inside. Geometry arrays are pre-computed at module
-    load time; only hue and text rendering vary per call.
+    load time; only hue and text rendering vary per call. Drawing happens in a
+    shared module buffer, so this must only be called from the GUI thread.
     """
-    img = np.zeros((_SIZE, _SIZE, 4), dtype=np.uint8)
-    img[:, :, 3] = _ALPHA_CHANNEL
-
     # Hue 0 (red) → 60 (green) mapped from score 0–100
     hue = int(np.clip(score * 60 / 100, 0, 60))
-    rgb_color = cv2.cvtColor(np.uint8([[[hue, 255, 255]]]), cv2.COLOR_HSV2BGR)[0][0]
+    rgb_color = _HUE_COLORS[hue]
     color = (int(rgb_color[0]), int(rgb_color[1]), int(rgb_color[2]), 255)
 
-    font = cv2.FONT_HERSHEY_DUPLEX
+    font = _FONT
+    thickness = _THICKNESS
     text = f"{int(score)}"
-    font_scale = 2.0 if len(text) == 1 else (1.5 if len(text) == 2 else 1.2)
-    thickness = 3
-    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
-    text_x = (_SIZE - text_size[0]) // 2
-    text_y = (_SIZE + text_size[1]) // 2
+    global _dirty_rows
+    font_scale, text_x, text_y, rows = _text_layout(text)
 
-    temp = img.copy()
+    temp = _ICON_BUF
+    temp[_dirty_rows] = _TEMPLATE[_dirty_rows]
+    _dirty_rows = rows
     for offset, alpha in zip([(2, 2), (1, 1)], [120, 180]):
         cv2.putText(
             temp,
@@ -67,6 +108,22 @@ def create_score_icon(score: float) -> QIcon:
     )
     cv2.putText(temp, text, (text_x, text_y), font, font_scale, color, thickness)
 
-    h, w, _ = temp.shape
-    q_img = QImage(temp.data, w, h, 4 * w, QImage.Format.Format_RGBA8888)
-    return QIcon(QPixmap.fromImage(q_img))
+    # _ICON_IMAGE wraps the shared buffer without copying. Converting to the
+    # raster engine's native premultiplied format detaches it in the same pass, so
+    # the pixmap neither aliases the reused buffer nor needs a second conversion copy.
+    native = _ICON_IMAGE.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    return QIcon(QPixmap.fromImage(native))
+
+
+def cached_score_icon(score: float) -> QIcon:
+    """Return the icon for *score* (0–100), rendering each integer value only once.
+
+    Scores are truncated and clamped first, so the cache never holds more than
+    the 101 reachable icons and floats share their integer's entry.
+    """
+    return _score_icon(min(max(int(score), 0), 100))
+
+
+@lru_cache(maxsize=101)
+def _score_icon(score: int) -> QIcon:
+    return create_score_icon(score)
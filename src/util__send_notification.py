@@ -6,11 +6,16 @@ Dispatch table:
 - Other  — ``plyer.notification`` (covers Windows and fallback platforms)
 
 All implementations use subprocess argument lists (never shell=True) to
-prevent injection from untrusted message or title strings.
+prevent injection from untrusted message or title strings. The helper tools are
+started detached and never waited on, so callers on the GUI thread don't block
+while the notification is shown.
 """
 import platform
 import subprocess
 
+# Resolved once; the platform cannot change while the process runs
+_SYSTEM = platform.system()
+
 
 def send_notification(message: str, title: str, icon_path: str) -> None:
     """Send a desktop notification using platform-native mechanisms.
@@ -22,20 +27,17 @@ def send_notification(message: str, title: str, icon_path: str) -> None:
         icon_path: Path to the app icon; used by notify-send (Linux) and plyer
                    (Windows). Ignored on macOS (AppleScript does not support icons).
 
-    Fails silently (``check=False``) if the notification daemon is unavailable.
+    Fails silently if the notification tool is missing or the daemon is unavailable.
     """
-    system = platform.system()
+    system = _SYSTEM
     if system == "Darwin":
         # Escape single quotes in the strings for AppleScript
         safe_message = message.replace("\\", "\\\\").replace('"', '\\"')
         safe_title = title.replace("\\", "\\\\").replace('"', '\\"')
         script = f'display notification "{safe_message}" with title "{safe_title}"'
-        subprocess.run(["osascript", "-e", script], check=False)
+        _spawn(["osascript", "-e", script])
     elif system == "Linux":
-        subprocess.run(
-            ["notify-send", title, message, "-i", icon_path],
-            check=False,
-        )
+        _spawn(["notify-send", title, message, "-i", icon_path])
     else:
         from plyer import notification
 
@@ -45,3 +47,17 @@ def send_notification(message: str, title: str, icon_path: str) -> None:
             app_icon=icon_path,
             timeout=10,
         )
+
+
+def _spawn(args: list) -> None:
+    """Start *args* detached without waiting for it to exit."""
+    try:
+        subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass